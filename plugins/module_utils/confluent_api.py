@@ -6,61 +6,446 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import io
+import os
 import random
+import tempfile
+import threading
 import time
+import uuid
 import base64
-import urllib
-
-from ansible.module_utils._text import to_text
+import json
+import hashlib
+import hmac
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from urllib.parse import quote, urlencode
+
+from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import env_fallback
 from ansible.module_utils.urls import fetch_url
 
+try:
+    import urllib3
+    HAS_URLLIB3 = True
+except ImportError:
+    HAS_URLLIB3 = False
+
+# ijson decodes JSON objects one member at a time so that unwanted members
+# of a large response are discarded without being built
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+# orjson decodes large listings several times faster and accepts the raw
+# response bytes, the standard library is used when it is not installed
+try:
+    import orjson
+
+    def _loads(data):
+        return(orjson.loads(data))
+
+    def _dumps(data):
+        return(orjson.dumps(data).decode())
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+
 CONFLUENT_USER_AGENT = "Ansible Confluent Cloud v1"
 
+# Content-Type is only added to requests that carry a body
+_BASE_HEADERS = {
+    "User-Agent": CONFLUENT_USER_AGENT,
+    "Accept": "application/json",
+}
+
+_MISSING = object()
+
+# Largest page_size accepted by the Confluent Cloud collection endpoints,
+# larger values are rejected rather than clamped
+MAX_PAGE_SIZE = 100
+
+# Statuses handled as success without content, their bodies are not read
+_EMPTY_STATUSES = (204, 404)
+
+# Pool managers are shared by every AnsibleConfluent instance in the process
+# so that paginated and sequential requests reuse keep-alive TLS connections
+_POOLS = {}
+
+
+def _get_pool(validate_certs):
+    pool = _POOLS.get(validate_certs)
+    if pool is None:
+        pool = urllib3.PoolManager(
+            num_pools=4,
+            maxsize=16,
+            retries=False,
+            cert_reqs="CERT_REQUIRED" if validate_certs else "CERT_NONE",
+        )
+        _POOLS[validate_certs] = pool
+    return(pool)
+
+
+# Opt-in directory holding the ETags of resources found up to date on a
+# previous run, each stored with a digest of the desired state it was
+# checked against
+ETAG_CACHE_VAR = "ANSIBLE_CONFLUENT_ETAG_CACHE"
+
+
+def etag_cache_dir():
+    path = os.environ.get(ETAG_CACHE_VAR)
+    return(os.path.expanduser(path) if path else None)
+
+
+def _etag_path(key):
+    directory = etag_cache_dir()
+    if not directory:
+        return(None)
+    return(os.path.join(directory, *[quote(str(k), safe="") for k in key]))
+
+
+def state_digest(state, secret):
+    # Keyed with the API secret so that secrets in state cannot be guessed
+    # from the digest stored on disk
+    return(hmac.new(secret.encode(), json.dumps(state, sort_keys=True).encode(), hashlib.sha256).hexdigest())
+
+
+def load_etag(key, digest):
+    # Returns the stored ETag when it was recorded for the same desired state
+    path = _etag_path(key)
+    if path is None:
+        return(None)
+    try:
+        with open(path) as f:
+            cached = json.load(f)
+    except (IOError, OSError, ValueError):
+        return(None)
+    if cached.get("digest") != digest:
+        return(None)
+    return(cached.get("etag"))
+
+
+def store_etag(key, etag, digest):
+    path = _etag_path(key)
+    if path is None:
+        return
+    try:
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({"etag": etag, "digest": digest}, f)
+    except (IOError, OSError):
+        pass
+
+
+def forget_etag(key):
+    path = _etag_path(key)
+    if path is None:
+        return
+    try:
+        os.remove(path)
+    except (IOError, OSError):
+        pass
+
+
+# Opt-in file through which the environment modules of a play share one
+# environments listing, it is trusted for LISTING_CACHE_TTL seconds
+ENVIRONMENTS_CACHE_VAR = "ANSIBLE_CONFLUENT_ENV_CACHE"
+LISTING_CACHE_TTL = 60
+
+
+def environments_cache_path():
+    path = os.environ.get(ENVIRONMENTS_CACHE_VAR)
+    return(os.path.expanduser(path) if path else None)
+
+
+# Same for the users and invitations listing shared by the user modules
+USERS_CACHE_VAR = "ANSIBLE_CONFLUENT_USERS_CACHE"
+
+
+def users_cache_path():
+    path = os.environ.get(USERS_CACHE_VAR)
+    return(os.path.expanduser(path) if path else None)
+
+
+def _read_cache_file(path, ttl, owner):
+    try:
+        if time.time() - os.path.getmtime(path) >= ttl:
+            return(None)
+        with open(path, "rb") as f:
+            cached = _loads(f.read())
+    except (IOError, OSError, ValueError):
+        return(None)
+    if cached.get("owner") != owner:
+        return(None)
+    return(cached.get("data"))
+
+
+def _write_cache_file(path, owner, data):
+    # Written to a temporary file first so concurrent readers never see a
+    # partial listing
+    try:
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory)
+    except (IOError, OSError):
+        return
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(_dumps({"owner": owner, "data": data}))
+        os.replace(tmp, path)
+    except Exception as e:
+        # Never leave the temporary file behind
+        try:
+            os.unlink(tmp)
+        except (IOError, OSError):
+            pass
+        if not isinstance(e, (IOError, OSError)):
+            raise
+
+
+def drop_listing_cache(path):
+    if not path:
+        return
+    try:
+        os.remove(path)
+    except (IOError, OSError):
+        pass
+
+
+def cached_listing(module, cache_path, name, compute, ttl=LISTING_CACHE_TTL):
+    # Returns the resources listed by compute(module), reusing a listing file
+    # written by an earlier module run for the same endpoint, key and name
+    owner = [module.params["api_endpoint"], module.params["api_key"], name]
+    resources = _read_cache_file(cache_path, ttl, owner)
+    if resources is None:
+        resources = list(compute(module))
+        _write_cache_file(cache_path, owner, resources)
+    return(resources)
+
+
+# Results of info modules run with cache_ttl, one file per distinct query
+_RESULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".ansible", "tmp", "confluent_cache")
+
+
+def cached_result(module, key_params, compute):
+    # Returns compute(module), reusing the result of an earlier run of the
+    # same compute with the same endpoint, key and key_params for cache_ttl
+    # seconds. The cached key of the result tells whether the file was used.
+    ttl = module.params.get("cache_ttl")
+    if not ttl:
+        return(compute(module))
+
+    p = module.params
+    owner = [compute.__name__, p["api_endpoint"], p["api_key"]] + [p.get(k) for k in key_params]
+    digest = hashlib.blake2b(json.dumps(owner, sort_keys=True).encode(), digest_size=16).hexdigest()
+    path = os.path.join(_RESULT_CACHE_DIR, digest + ".json")
+
+    result = _read_cache_file(path, ttl, owner)
+    if result is not None:
+        return(dict(result, cached=True))
+
+    result = compute(module)
+    _write_cache_file(path, owner, result)
+    return(dict(result, cached=False))
+
+
+@lru_cache(maxsize=4)
+def _basic_auth(api_key, api_secret):
+    auth = "%s:%s" % (api_key, api_secret)
+    return("Basic %s" % (base64.standard_b64encode(auth.encode()).decode()))
+
+
+def _proxy_configured():
+    return(any(os.environ.get(v) for v in ("https_proxy", "HTTPS_PROXY", "all_proxy", "ALL_PROXY")))
+
+
+# Built once at import, confluent_argument_spec hands out copies since
+# modules add their own options to it
+_ARG_SPEC = dict(
+    api_endpoint=dict(
+        type="str",
+        fallback=(env_fallback, ["CONFLUENT_API_ENDPOINT"]),
+        default="https://api.confluent.cloud",
+    ),
+    api_key=dict(
+        type="str",
+        fallback=(env_fallback, ["CONFLUENT_API_KEY"]),
+        required=True,
+        no_log=False,
+    ),
+    api_secret=dict(
+        type="str",
+        fallback=(env_fallback, ["CONFLUENT_API_SECRET"]),
+        no_log=True,
+        required=True,
+    ),
+    api_timeout=dict(
+        type="int",
+        fallback=(env_fallback, ["CONFLUENT_API_TIMEOUT"]),
+        default=60,
+    ),
+    api_retries=dict(type="int", fallback=(env_fallback, ["CONFLUENT_API_RETRIES"]), default=5),
+    api_retry_max_delay=dict(
+        type="int",
+        fallback=(env_fallback, ["CONFLUENT_API_RETRY_MAX_DELAY"]),
+        default=12,
+    ),
+    validate_certs=dict(
+        type="bool",
+        default=True,
+    ),
+)
+
 
 def confluent_argument_spec():
-    return dict(
-        api_endpoint=dict(
-            type="str",
-            fallback=(env_fallback, ["CONFLUENT_API_ENDPOINT"]),
-            default="https://api.confluent.cloud",
-        ),
-        api_key=dict(
-            type="str",
-            fallback=(env_fallback, ["CONFLUENT_API_KEY"]),
-            required=True,
-            no_log=False,
-        ),
-        api_secret=dict(
-            type="str",
-            fallback=(env_fallback, ["CONFLUENT_API_SECRET"]),
-            no_log=True,
-            required=True,
-        ),
-        api_timeout=dict(
-            type="int",
-            fallback=(env_fallback, ["CONFLUENT_API_TIMEOUT"]),
-            default=60,
-        ),
-        api_retries=dict(type="int", fallback=(env_fallback, ["CONFLUENT_API_RETRIES"]), default=5),
-        api_retry_max_delay=dict(
-            type="int",
-            fallback=(env_fallback, ["CONFLUENT_API_RETRY_MAX_DELAY"]),
-            default=12,
-        ),
-        validate_certs=dict(
-            type="bool",
-            default=True,
-        ),
+    return(dict((k, dict(v)) for k, v in _ARG_SPEC.items()))
+
+
+def filter_listing(module, filters, data):
+    # Info module filters, given as (option, key, api_param) in order of
+    # precedence. The first option given applies: the listing is kept where
+    # key(resource) is one of its values, and a single value is also sent as
+    # api_param when the API can filter on it. Returns the query data and the
+    # predicate, None when no filter is given.
+    for option, key, api_param in filters:
+        wanted = frozenset(module.params.get(option) or ())
+        if wanted:
+            if api_param and len(wanted) == 1:
+                data = dict(data, **{api_param: next(iter(wanted))})
+            return(data, lambda r: key(r) in wanted)
+    return(data, None)
+
+
+def index_resources(resources, name_key):
+    # Indexes resources by id and by name_key(resource) in a single pass,
+    # the first resource listed wins when a name is shared
+    by_id = {}
+    by_name = {}
+    for r in resources:
+        by_id.setdefault(r['id'], r)
+        by_name.setdefault(name_key(r), r)
+    return(by_id, by_name)
+
+
+class ConfluentAPIError(Exception):
+    # Raised instead of failing the module when an API call fails on a worker
+    # thread, details are the keyword arguments fail_json would have received
+    def __init__(self, msg, **details):
+        super(ConfluentAPIError, self).__init__(msg)
+        self.msg = msg
+        self.details = details
+
+
+def map_concurrently(module, fn, items, max_workers=8, result_key=None):
+    # Returns [fn(item) for item in items] computed on worker threads. API
+    # errors raised by the workers are collected and the module is failed
+    # once, from the calling thread. With result_key, the results of the
+    # items that succeeded are reported alongside the errors, keyed by item.
+    items = list(items)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(fn, item) for item in items]
+
+    results = []
+    errors = []
+    succeeded = {}
+    for item, future in zip(items, futures):
+        try:
+            result = future.result()
+        except ConfluentAPIError as e:
+            errors.append(dict(e.details, item=item, msg=e.msg))
+            continue
+        results.append(result)
+        succeeded[item] = result
+
+    if errors:
+        failure = dict(
+            msg="%s (%d of %d requests failed)" % (errors[0]['msg'], len(errors), len(items)),
+            errors=errors,
+        )
+        if result_key:
+            failure[result_key] = succeeded
+            failure['changed'] = any(r.get('changed') for r in succeeded.values())
+        module.fail_json(**failure)
+    return(results)
+
+
+def canonical_api_key(resource):
+    # Flattens the spec of an API key into the shape returned by the api_key
+    # modules, the secret is only present in a create response
+    spec = resource.pop('spec')
+    resource['name'] = spec['display_name']
+    resource['description'] = spec.get('description')
+    resource['owner'] = spec.get('owner')
+    resource['resource'] = spec.get('resource')
+    if 'secret' in spec:
+        resource['secret'] = spec['secret']
+    return(resource)
+
+
+def invited_user(invitation):
+    # Pending invitations are listed as users keyed by their future user id
+    return(dict(invitation, full_name=None, invitation=invitation['id'], id=invitation['user']['id']))
+
+
+def _list_all(module, resource_path):
+    confluent = AnsibleConfluent(
+        module=module,
+        resource_path=resource_path,
     )
 
+    return(confluent.query_all_pages(data={'page_size': MAX_PAGE_SIZE}))
+
 
-def backoff(retry, retry_max_delay=12):
-    randomness = random.randint(0, 1000) / 1000.0
-    delay = 2**retry + randomness
-    if delay > retry_max_delay:
-        delay = retry_max_delay + randomness
+def _list_users(module):
+    # The two listings are independent, they are requested concurrently
+    users, invitations = map_concurrently(
+        module,
+        lambda path: _list_all(module, path),
+        ("/iam/v2/users", "/iam/v2/invitations"),
+        max_workers=2,
+    )
+
+    users.extend(invited_user(i) for i in invitations)
+    return(users)
+
+
+def list_users(module):
+    # Users and pending invitations in one listing, shared by the user and
+    # user_info modules through the opt-in users cache file
+    cache_path = users_cache_path()
+    if cache_path:
+        return(cached_listing(module, cache_path, 'users', _list_users))
+    return(_list_users(module))
+
+
+def backoff(retry, retry_max_delay=12, prev_delay=None, retry_after=None):
+    # Decorrelated jitter, each delay is drawn from a range based on the
+    # previous one so concurrent workers do not retry in lockstep at the cap.
+    # A server supplied Retry-After takes precedence.
+    if retry_after is not None:
+        delay = retry_after
+    else:
+        upper = prev_delay * 3 if prev_delay else 2 ** (retry + 1)
+        delay = min(retry_max_delay, random.uniform(1, upper))
     time.sleep(delay)
+    return(delay)
+
+
+def _parse_retry_after(value):
+    # Retry-After is either a number of seconds or an HTTP-date
+    if not value:
+        return(None)
+    try:
+        return(max(0.0, float(value)))
+    except ValueError:
+        pass
+    try:
+        return(max(0.0, parsedate_to_datetime(value).timestamp() - time.time()))
+    except (TypeError, ValueError):
+        return(None)
 
 
 class AnsibleConfluent:
@@ -89,14 +474,16 @@ class AnsibleConfluent:
         # Some resources have PUT, many have PATCH
         self.resource_update_method = resource_update_method
 
-        auth = "%s:%s" % (self.module.params["api_key"],
-                          self.module.params["api_secret"])
-        self.headers = {
-            "Authorization": "Basic %s" % (base64.standard_b64encode(auth.encode()).decode()),
-            "User-Agent": CONFLUENT_USER_AGENT,
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+        # Connection settings read once, they are used on every request
+        self.api_endpoint = self.module.params["api_endpoint"]
+        self.api_timeout = self.module.params["api_timeout"]
+        self.api_retries = self.module.params["api_retries"]
+        self.api_retry_max_delay = self.module.params["api_retry_max_delay"]
+        self.validate_certs = self.module.params["validate_certs"]
+
+        self.headers = dict(_BASE_HEADERS)
+        self.headers["Authorization"] = _basic_auth(self.module.params["api_key"],
+                                                    self.module.params["api_secret"])
 
         # Hook custom configurations
         self.configure()
@@ -104,95 +491,281 @@ class AnsibleConfluent:
     def configure(self):
         pass
 
-    def api_next_page(self, uri):
-        info = dict()
-        resp_body = None
-        for retry in range(0, self.module.params["api_retries"]):
+    def _fail(self, msg, **details):
+        # Only the main thread may end the module, a worker thread raises so
+        # that map_concurrently reports every failure in a single result
+        if threading.current_thread() is not threading.main_thread():
+            raise ConfluentAPIError(msg, **details)
+        self.module.fail_json(msg=msg, **details)
+
+    def _send(self, url, method="GET", data=None, extra_headers=None):
+        headers = self.headers
+        if data is not None or extra_headers:
+            headers = dict(headers)
+            if data is not None:
+                headers["Content-Type"] = "application/json"
+            if extra_headers:
+                headers.update(extra_headers)
+
+        # fetch_url opens a new connection per request, it remains the
+        # fallback when urllib3 is unavailable or a proxy is configured
+        if not HAS_URLLIB3 or _proxy_configured():
             resp, info = fetch_url(
                 self.module,
-                uri,
-                headers=self.headers,
-                timeout=self.module.params["api_timeout"],
+                url,
+                method=method,
+                data=data,
+                headers=headers,
+                timeout=self.api_timeout,
             )
+            # Responses without content are never read
+            resp_body = ""
+            if resp is not None and info["status"] not in _EMPTY_STATUSES:
+                resp_body = resp.read()
+            return(resp_body, info)
+
+        try:
+            resp = _get_pool(self.validate_certs).request(
+                method,
+                url,
+                body=data,
+                headers=headers,
+                timeout=self.api_timeout,
+                preload_content=False,
+            )
+            try:
+                if resp.status in _EMPTY_STATUSES:
+                    # Discard rather than buffer so the connection can be reused
+                    resp.drain_conn()
+                    resp_body = ""
+                else:
+                    resp_body = resp.read()
+            finally:
+                resp.release_conn()
+        except urllib3.exceptions.HTTPError as e:
+            return("", {'status': -1, 'msg': "Request failed: %s" % to_native(e), 'url': url})
+
+        # Mirror the info dict returned by fetch_url, lowercased headers included
+        info = dict((k.lower(), v) for k, v in resp.headers.items())
+        info.update({'status': resp.status, 'msg': resp.reason, 'url': url})
+        if resp.status >= 400:
+            info['body'] = resp_body
+        return(resp_body, info)
+
+    def _fetch(self, url, method="GET", data=None, headers=None):
+        # The same key is sent on every retry so that a write which succeeded
+        # but whose response was lost is not applied twice
+        extra_headers = headers
+        if method in ("POST", "PUT", "PATCH"):
+            extra_headers = dict(headers or {})
+            extra_headers["Idempotency-Key"] = uuid.uuid4().hex
 
-            resp_body = resp.read() if resp is not None else ""
+        info = dict()
+        resp_body = None
+        delay = None
+        retries = self.api_retries
+        max_delay = self.api_retry_max_delay
+        deadline = time.monotonic() + self.api_timeout
+        for retry in range(0, retries):
+            resp_body, info = self._send(url, method=method, data=data, extra_headers=extra_headers)
+
+            # Check for 429 Too Many Requests or an overloaded gateway
+            if info["status"] not in (429, 502, 503, 504) or retry == retries - 1:
+                break
 
-            # Check for 429 Too Many Requests
-            if info["status"] != 429:
+            # Never wait past the api_timeout budget, including when the
+            # server asks for a longer Retry-After
+            remaining = deadline - time.monotonic()
+            retry_after = _parse_retry_after(info.get("retry-after"))
+            if remaining <= 0 or (retry_after is not None and retry_after > remaining):
                 break
 
             # Confluent Cloud has a rate limiting requests per second, try to
             # be polite.  Use exponential backoff plus a little bit of randomness
-            backoff(retry=retry, retry_max_delay=self.module.params["api_retry_max_delay"])
-
-        if info["status"] in (200, 201, 202):
-            # Request subsequent page if next
-            resp = self.module.from_json(to_text(resp_body, errors="surrogate_or_strict"))
-            if 'metadata' in resp and 'next' in resp['metadata']:
-                resp['data'] += self.api_next_page(resp['metadata']['next'])
-
-            return(resp['data'])
+            delay = backoff(
+                retry=retry,
+                retry_max_delay=min(max_delay, remaining),
+                prev_delay=delay,
+                retry_after=retry_after,
+            )
 
-        else:
-            return([])
+        return(resp_body, info)
+
+    def _iter_pages(self, uri, prefetch=False):
+        # Yields the data of each page following the metadata.next links.
+        # Page tokens are opaque so pages cannot be requested out of order,
+        # with prefetch the next page is fetched in the background while the
+        # caller processes the current one.
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        pending = None
+        try:
+            while uri:
+                if pending is not None:
+                    resp_body, info = pending.result()
+                else:
+                    resp_body, info = self._fetch(uri)
+
+                if info["status"] in _EMPTY_STATUSES:
+                    return
+                if info["status"] not in (200, 201, 202):
+                    self._fail(
+                        msg='Failure while calling the Confluent Cloud API with GET for "%s".' % uri,
+                        fetch_url_info=info,
+                    )
+
+                resp = _loads(resp_body)
+                uri = resp.get('metadata', {}).get('next')
+                if executor is not None and uri:
+                    pending = executor.submit(self._fetch, uri)
+
+                yield resp['data']
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    def api_next_page(self, uri, prefetch=False, transform=None, data=None):
+        # Extends data in place with every page from uri onwards
+        if data is None:
+            data = []
+        for page in self._iter_pages(uri, prefetch=prefetch):
+            if transform is None:
+                data.extend(page)
+            else:
+                data.extend(transform(r) for r in page)
+        return(data)
 
-    def api_query(self, path, method="GET", data=None):
+    def api_query(self, path, method="GET", data=None, prefetch=False, transform=None):
         params = ''
         if method in ('GET', 'DELETE') and data:
-            try:
-                params = '?' + urllib.urlencode(data)
-            except AttributeError:
-                params = '?' + urllib.parse.urlencode(data)
+            params = '?' + urlencode(data)
             data = None
-        else:
-            data = self.module.jsonify(data)
+        elif data is not None:
+            data = _dumps(data)
 
-        info = dict()
-        resp_body = None
-        for retry in range(0, self.module.params["api_retries"]):
-            resp, info = fetch_url(
-                self.module,
-                self.module.params["api_endpoint"] + path + params,
-                method=method,
-                data=data,
-                headers=self.headers,
-                timeout=self.module.params["api_timeout"],
-            )
-
-            resp_body = resp.read() if resp is not None else ""
-
-            # Check for 429 Too Many Requests
-            if info["status"] != 429:
-                break
+        resp_body, info = self._fetch(
+            self.api_endpoint + path + params,
+            method=method,
+            data=data,
+        )
 
-            # Confluent Cloud has a rate limiting requests per second, try to
-            # be polite.  Use exponential backoff plus a little bit of randomness
-            backoff(retry=retry, retry_max_delay=self.module.params["api_retry_max_delay"])
+        # Success without content
+        if info["status"] in _EMPTY_STATUSES:
+            return dict()
 
         # Success with content
         if info["status"] in (200, 201, 202):
+            if not resp_body:
+                return dict()
+
             # Request subsequent page if next
-            resp = self.module.from_json(to_text(resp_body, errors="surrogate_or_strict"))
+            resp = _loads(resp_body)
+            if transform is not None and 'data' in resp:
+                resp['data'] = [transform(r) for r in resp['data']]
             if 'metadata' in resp and 'next' in resp['metadata']:
-                resp['data'] += self.api_next_page(resp['metadata']['next'])
+                self.api_next_page(resp['metadata']['next'], prefetch=prefetch, transform=transform, data=resp['data'])
 
             return(resp)
 
-        # Success without content
-        if info["status"] in (404, 204):
-            return dict()
-
-        self.module.fail_json(
+        self._fail(
             msg='Failure while calling the Confluent Cloud API with %s for "%s".' % (method, path),
             fetch_url_info=info,
             data=data
         )
 
-    def query(self, method="GET", data=None):
-        # Returns a single dict representing the resource
-        resources = self.api_query(path=self.resource_path, method=method, data=data)
+    def iter_query(self, data=None, prefetch=False, transform=None):
+        # Yields the listed resources one at a time, pages are only requested
+        # as the caller consumes them so stopping early saves the remainder
+        uri = self.api_endpoint + self.resource_path
+        if data:
+            uri += '?' + urlencode(data)
+
+        for page in self._iter_pages(uri, prefetch=prefetch):
+            for r in page:
+                yield r if transform is None else transform(r)
+
+    def query(self, method="GET", data=None, prefetch=False, transform=None):
+        # Returns a single dict representing the resource, transform is
+        # applied to each listed item as the pages are read. Like create,
+        # update and absent, anything but a read is skipped in check mode
+        if method != "GET" and self.module.check_mode:
+            return(dict())
+        resources = self.api_query(path=self.resource_path, method=method, data=data, prefetch=prefetch, transform=transform)
+        return(resources)
+
+    def query_all_pages(self, data=None):
+        # Returns every listed resource as a single list. Page tokens are
+        # opaque so the pages cannot be requested concurrently, the next page
+        # is requested while the current one is being collected instead.
+        uri = self.api_endpoint + self.resource_path
+        if data:
+            uri += '?' + urlencode(data)
+        return(self.api_next_page(uri, prefetch=True))
+
+    def query_items(self, data=None, predicate=None):
+        # Returns the members of a resource answered as a JSON object keyed
+        # by name, such as the expanded connectors listing, keeping only those
+        # accepted by predicate
+        uri = self.api_endpoint + self.resource_path
+        if data:
+            uri += '?' + urlencode(data)
+
+        resp_body, info = self._fetch(uri)
+        if info["status"] in _EMPTY_STATUSES:
+            return(dict())
+        if info["status"] not in (200, 201, 202):
+            self._fail(
+                msg='Failure while calling the Confluent Cloud API with GET for "%s".' % uri,
+                fetch_url_info=info,
+            )
+        if not resp_body:
+            return(dict())
+
+        if HAS_IJSON:
+            if not isinstance(resp_body, bytes):
+                resp_body = resp_body.encode()
+            items = ijson.kvitems(io.BytesIO(resp_body), '', use_float=True)
+        else:
+            items = _loads(resp_body).items()
+        return(dict((k, v) for k, v in items if predicate is None or predicate(v)))
+
+    def query_all_pages_cached(self, cache_path, data=None, ttl=LISTING_CACHE_TTL):
+        # query_all_pages backed by a listing file written by an earlier
+        # module run, the file is only used for the same endpoint, key and query
+        owner = [self.api_endpoint, self.module.params["api_key"], self.resource_path, data]
+        resources = _read_cache_file(cache_path, ttl, owner)
+        if resources is None:
+            resources = self.query_all_pages(data=data)
+            _write_cache_file(cache_path, owner, resources)
         return(resources)
 
+    def get(self, data=None):
+        # Returns the resource identified by resource_key_id, an empty dict
+        # when it does not exist
+        return(self.api_query(
+            path="%s/%s" % (self.resource_path, self.resource_key_id),
+            data=data,
+        ))
+
+    def get_if_none_match(self, etag=None):
+        # Conditional GET of the resource identified by resource_key_id.
+        # Returns (resource, etag), resource is None when the server answered
+        # 304 Not Modified and an empty dict when the resource does not exist
+        headers = {"If-None-Match": etag} if etag else None
+        url = "%s%s/%s" % (self.api_endpoint, self.resource_path, self.resource_key_id)
+        resp_body, info = self._fetch(url, headers=headers)
+
+        if info["status"] == 304:
+            return(None, etag)
+        if info["status"] in _EMPTY_STATUSES:
+            return(dict(), None)
+        if info["status"] not in (200, 201, 202):
+            self._fail(
+                msg='Failure while calling the Confluent Cloud API with GET for "%s".' % url,
+                fetch_url_info=info,
+            )
+
+        return(_loads(resp_body) if resp_body else dict(), info.get("etag"))
+
     def create(self, data):
         resource = dict()
 
@@ -222,15 +795,20 @@ class AnsibleConfluent:
     def _delta_state(self, cur, target):
         delta = {}
         for key, val in target.items():
-            if key not in cur:
+            cur_val = cur.get(key, _MISSING)
+            if cur_val is _MISSING:
                 # assume if key doesn't exist in cur state then it optional
-                pass
-            elif isinstance(target[key], (float, int, str, list, tuple)) and cur[key] != val:
+                continue
+
+            if isinstance(val, dict):
+                if isinstance(cur_val, dict):
+                    o = self._delta_state(cur_val, val)
+                    if o:
+                        delta[key] = o
+                else:
+                    delta[key] = val
+            elif isinstance(val, (float, int, str, list, tuple)) and cur_val != val:
                 delta[key] = val
-            elif isinstance(val, dict):
-                o = self._delta_state(cur[key], val)
-                if len(o.keys()):
-                    delta[key] = o
         return(delta)
 
     def update(self, cur_state, target_state, required=None):
@@ -238,7 +816,7 @@ class AnsibleConfluent:
 
         delta_state = self._delta_state(cur_state, target_state)
 
-        if len(delta_state.keys()):
+        if delta_state:
             resource['changed'] = True
             if required:
                 delta_state = self._merge_dicts(delta_state, required)
@@ -132,25 +132,27 @@ import traceback
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
 
-from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import AnsibleConfluent, confluent_argument_spec
+from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import AnsibleConfluent, MAX_PAGE_SIZE, canonical_api_key, confluent_argument_spec
 
+_ARG_SPEC = dict(
+    confluent_argument_spec(),
+    id=dict(type='str'),
+    name=dict(type='str'),
+    description=dict(type='str'),
+    state=dict(default='present', choices=['present', 'absent']),
+    owner=dict(type='str'),
+    resource=dict(type='str', default=None),
+)
 
-def api_key_remove(module, resource_id):
-    confluent = AnsibleConfluent(
-        module=module,
-        resource_path="/iam/v2/api-keys",
-        resource_key_id=resource_id
-    )
+
+def api_key_remove(confluent, resource_id):
+    confluent.resource_key_id = resource_id
 
     return(confluent.absent())
 
 
-def api_key_update(module, api_key):
-    confluent = AnsibleConfluent(
-        module=module,
-        resource_path="/iam/v2/api-keys",
-        resource_key_id=api_key['id']
-    )
+def api_key_update(module, confluent, api_key):
+    confluent.resource_key_id = api_key['id']
 
     return(confluent.update(api_key, {
         'spec': {
@@ -160,13 +162,8 @@ def api_key_update(module, api_key):
     }))
 
 
-def api_key_create(module):
-    confluent = AnsibleConfluent(
-        module=module,
-        resource_path="/iam/v2/api-keys",
-    )
-
-    request = confluent.create({
+def api_key_create(module, confluent):
+    request = {
         'spec': {
             'display_name': module.params.get('name'),
             'description': module.params.get('description'),
@@ -174,7 +171,7 @@ def api_key_create(module):
                 'id': module.params.get('owner'),
             },
         },
-    })
+    }
     if module.params.get('resource'):
         request['spec']['resource'] = {
             'id': module.params.get('resource'),
@@ -183,69 +180,63 @@ def api_key_create(module):
     response = confluent.create(request)
 
     if 'spec' in response:
-        response['name'] = response['spec']['display_name']
-        response.update({k: response['spec'][k] for k in response['spec'].keys() if k in ('description', 'owner', 'resource', 'secret')})
-        del(response['spec'])
+        response = canonical_api_key(response)
 
     return(response)
 
 
-def get_api_keys(module):
-    confluent = AnsibleConfluent(
-        module=module,
-        resource_path="/iam/v2/api-keys",
-    )
+def get_api_key(module, confluent):
+    # A known id is fetched directly
+    if module.params.get('id'):
+        confluent.resource_key_id = module.params.get('id')
+        api_key = confluent.get()
+        if api_key:
+            return(canonical_api_key(api_key))
 
-    resources = confluent.query(data={'page_size': 100})
+    if not module.params.get('name'):
+        return(None)
 
-    # Transform key data
-    api_keys = []
-    for a in resources['data']:
-        a['name'] = a['spec']['display_name']
-        a.update({k: a['spec'][k] for k in a['spec'].keys() if k in ('description', 'owner', 'resource', 'secret')})
-        del(a['spec'])
-        api_keys.append(a)
+    # Otherwise list keys, narrowed to the owner when one is supplied, and
+    # stop paging as soon as the requested name is found
+    data = {'page_size': MAX_PAGE_SIZE}
+    if module.params.get('owner'):
+        data['spec.owner'] = module.params.get('owner')
 
-    return(api_keys)
+    for ak in confluent.iter_query(data=data, transform=canonical_api_key):
+        if ak['name'] == module.params.get('name'):
+            return(ak)
+
+    return(None)
 
 
 def api_key_process(module):
-    # Get existing api_key if it exists
-    api_keys = get_api_keys(module)
+    # A single client is shared by every request made for this task
+    confluent = AnsibleConfluent(
+        module=module,
+        resource_path="/iam/v2/api-keys",
+    )
 
-    if module.params.get('id') and len([ak for ak in api_keys if ak['id'] == module.params.get('id')]):
-        api_key = [ak for ak in api_keys if ak['id'] == module.params.get('id')][0]
-    elif module.params.get('name') and len([u for u in api_keys if u['name'] == module.params.get('name')]):
-        api_key = [ak for ak in api_keys if ak['name'] == module.params.get('name')][0]
-    else:
-        api_key = None
+    # Get existing api_key if it exists
+    api_key = get_api_key(module, confluent)
 
     # Manage api_key removal
     if module.params.get('state') == 'absent' and not api_key:
         return({"changed": False})
     elif module.params.get('state') == 'absent' and api_key:
-        return(api_key_remove(module, api_key['id']))
+        return(api_key_remove(confluent, api_key['id']))
 
     # Create api_key
     elif module.params.get('state') == 'present' and not api_key:
-        return(api_key_create(module))
+        return(api_key_create(module, confluent))
 
     # Check for update
     else:
-        return(api_key_update(module, api_key))
+        return(api_key_update(module, confluent, api_key))
 
 
 def main():
-    argument_spec = confluent_argument_spec()
-    argument_spec['id'] = dict(type='str')
-    argument_spec['name'] = dict(type='str')
-    argument_spec['description'] = dict(type='str')
-    argument_spec['state'] = dict(default='present', choices=['present', 'absent'])
-    argument_spec['owner'] = dict(type='str')
-    argument_spec['resource'] = dict(type='str', default=None)
-
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=_ARG_SPEC,
         supports_check_mode=True,
     )
 
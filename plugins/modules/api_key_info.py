@@ -121,7 +121,29 @@ import traceback
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
 
-from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import AnsibleConfluent, confluent_argument_spec
+from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import (
+    AnsibleConfluent,
+    MAX_PAGE_SIZE,
+    canonical_api_key,
+    confluent_argument_spec,
+    filter_listing,
+)
+
+_ARG_SPEC = dict(
+    confluent_argument_spec(),
+    ids=dict(type='list', elements='str'),
+    owners=dict(type='list', elements='str'),
+    names=dict(type='list', elements='str'),
+)
+
+
+# Filter option, the field it matches and the API query parameter, see
+# filter_listing
+_FILTERS = (
+    ('ids', lambda a: a['id'], None),
+    ('owners', lambda a: a['spec']['owner']['id'], 'spec.owner'),
+    ('names', lambda a: a['spec']['display_name'], None),
+)
 
 
 def get_api_keys_info(module):
@@ -130,37 +152,23 @@ def get_api_keys_info(module):
         resource_path="/iam/v2/api-keys",
     )
 
-    resources = confluent.query(data={'page_size': 100})
+    data, predicate = filter_listing(module, _FILTERS, {'page_size': MAX_PAGE_SIZE})
+    resources = confluent.query_all_pages(data=data)
+    if not resources:
+        return({'api_keys': {}})
 
-    # Filter keys
-    if resources and module.params.get('ids'):
-        api_keys_raw = [a for a in resources['data'] if a['id'] in module.params.get('ids')]
-    elif resources and module.params.get('owner'):
-        api_keys_raw = [a for a in resources['data'] if a['spec']['owner']['id'] in module.params.get('owner')]
-    elif resources and module.params.get('names'):
-        api_keys_raw = [a for a in resources['data'] if a['spec']['display_name'] in module.params.get('names')]
-    else:
-        api_keys_raw = resources['data']
+    # Filter, transform and index keys in a single pass
+    api_keys = {}
+    for a in resources:
+        if predicate is None or predicate(a):
+            api_keys[a['id']] = canonical_api_key(a)
 
-    # Transform key data
-    api_keys = []
-    for a in api_keys_raw:
-        a['name'] = a['spec']['display_name']
-        a.update({k: a['spec'][k] for k in a['spec'].keys() if k in ('description', 'owner', 'resource', 'secret')})
-        del(a['spec'])
-        api_keys.append(a)
-
-    return({'api_keys': {a['id']: a for a in api_keys}})
+    return({'api_keys': api_keys})
 
 
 def main():
-    argument_spec = confluent_argument_spec()
-    argument_spec['ids'] = dict(type='list', elements='str')
-    argument_spec['owners'] = dict(type='list', elements='str')
-    argument_spec['names'] = dict(type='list', elements='str')
-
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=_ARG_SPEC,
         supports_check_mode=True,
         mutually_exclusive=[
             ('ids', 'owners', 'names')
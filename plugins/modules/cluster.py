@@ -228,12 +228,26 @@ import traceback
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
 
-from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import AnsibleConfluent, confluent_argument_spec
+from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import AnsibleConfluent, MAX_PAGE_SIZE, confluent_argument_spec
+
+_ARG_SPEC = dict(
+    confluent_argument_spec(),
+    id=dict(type='str'),
+    name=dict(type='str'),
+    state=dict(default='present', choices=['present', 'absent']),
+    environment=dict(type='str', required=True),
+    availability=dict(default='SINGLE_ZONE', choices=['SINGLE_ZONE', 'MULTI_ZONE']),
+    cloud=dict(type='str', choices=['AWS', 'GCP', 'AZURE']),
+    region=dict(type='str'),
+    kind=dict(type='str', default='Basic', choices=['Basic', 'Standard', 'Dedicated']),
+    cku=dict(type='int', default=1),
+    network=dict(type='str'),
+    encryption_key=dict(type='str', no_log=False),
+)
 
 
 def canonical_resource(resource):
-    resource['resource_uri'] = resource['metadata']['resource_name']
-    del(resource['metadata']['resource_name'])
+    resource['resource_uri'] = resource['metadata'].pop('resource_name')
     return(resource)
 
 
@@ -248,55 +262,53 @@ def cluster_remove(module, resource_id):
 
 
 def cluster_create(module):
+    p = module.params
+
     confluent = AnsibleConfluent(
         module=module,
         resource_path="/cmk/v2/clusters",
     )
 
-    return(canonical_resource(confluent.create({
-        'spec': {
-            'display_name': module.params.get('name'),
-            'availability': module.params.get('availability'),
-            'cloud': module.params.get('cloud'),
-            'region': module.params.get('region'),
-            'config': {
-                'kind': module.params.get('kind'),
-                'cku': module.params.get('cku'),
-                'encryption_key': module.params.get('encryption_key'),
-            },
-            'environment': {
-                'id': module.params.get('environment'),
-            },
-            'network': {
-                'id': module.params.get('network'),
-            },
+    spec = {
+        'display_name': p['name'],
+        'availability': p['availability'],
+        'cloud': p['cloud'],
+        'region': p['region'],
+        'config': {
+            'kind': p['kind'],
+            'cku': p['cku'],
+            'encryption_key': p['encryption_key'],
         },
-    })))
+        'environment': {'id': p['environment']},
+        'network': {'id': p['network']},
+    }
+
+    return(canonical_resource(confluent.create({'spec': spec})))
 
 
 def cluster_update(module, cluster):
+    p = module.params
+
     confluent = AnsibleConfluent(
         module=module,
         resource_path="/cmk/v2/clusters",
         resource_key_id=cluster['id']
     )
 
-    return(canonical_resource(confluent.update(cluster, {
-        'spec': {
-            'display_name': module.params.get('name'),
-            'config': {
-                'kind': module.params.get('kind'),
-                'cku': module.params.get('cku'),
-                'encryption_key': module.params.get('encryption_key'),
-            },
+    spec = {
+        'display_name': p['name'],
+        'config': {
+            'kind': p['kind'],
+            'cku': p['cku'],
+            'encryption_key': p['encryption_key'],
         },
-    }, required={
-        'spec': {
-            'environment': {
-                'id': module.params.get('environment'),
-            },
-        },
-    })))
+    }
+
+    return(canonical_resource(confluent.update(
+        cluster,
+        {'spec': spec},
+        required={'spec': {'environment': {'id': p['environment']}}},
+    )))
 
 
 def get_clusters(module):
@@ -305,33 +317,50 @@ def get_clusters(module):
         resource_path="/cmk/v2/clusters",
     )
 
-    resources = confluent.query(data={'environment': module.params.get('environment'), 'page_size': 100})
+    return(confluent.query_all_pages(data={'environment': module.params.get('environment'), 'page_size': MAX_PAGE_SIZE}))
 
-    if 'data' in resources:
-        return(resources['data'])
-    else:
-        return([])
+
+def get_cluster(module, resource_id):
+    # Reads a single cluster, an empty dict when it does not exist
+    confluent = AnsibleConfluent(
+        module=module,
+        resource_path="/cmk/v2/clusters",
+        resource_key_id=resource_id,
+    )
+
+    return(confluent.get(data={'environment': module.params.get('environment')}))
+
+
+def find_cluster(module):
+    # An id is read directly, a name is searched for in the listing
+    wanted_id = module.params.get('id')
+    wanted_name = module.params.get('name')
+
+    if wanted_id:
+        cluster = get_cluster(module, wanted_id)
+        if cluster:
+            return(cluster)
+
+    if wanted_name:
+        return(next((c for c in get_clusters(module) if c['spec']['display_name'] == wanted_name), None))
+
+    return(None)
 
 
 def cluster_process(module):
-    # Get existing cluster if it exists
-    clusters = get_clusters(module)
+    state = module.params['state']
 
-    if clusters and module.params.get('id') and len([e for e in clusters if e['id'] in module.params.get('id')]):
-        cluster = [e for e in clusters if e['id'] in module.params.get('id')][0]
-    elif clusters and module.params.get('name') and len([e for e in clusters if e['spec']['display_name'] in module.params.get('name')]):
-        cluster = [e for e in clusters if e['spec']['display_name'] in module.params.get('name')][0]
-    else:
-        cluster = None
+    # Get existing cluster if it exists
+    cluster = find_cluster(module)
 
     # Manage cluster removal
-    if module.params.get('state') == 'absent' and not cluster:
+    if state == 'absent' and not cluster:
         return({"changed": False})
-    elif module.params.get('state') == 'absent' and cluster:
+    elif state == 'absent' and cluster:
         return(cluster_remove(module, cluster['id']))
 
     # Create cluster
-    elif module.params.get('state') == 'present' and not cluster:
+    elif state == 'present' and not cluster:
         return(cluster_create(module))
 
     # Check for update
@@ -340,21 +369,8 @@ def cluster_process(module):
 
 
 def main():
-    argument_spec = confluent_argument_spec()
-    argument_spec['id'] = dict(type='str')
-    argument_spec['name'] = dict(type='str')
-    argument_spec['state'] = dict(default='present', choices=['present', 'absent'])
-    argument_spec['environment'] = dict(type='str', required=True)
-    argument_spec['availability'] = dict(default='SINGLE_ZONE', choices=['SINGLE_ZONE', 'MULTI_ZONE'])
-    argument_spec['cloud'] = dict(type='str', choices=['AWS', 'GCP', 'AZURE'])
-    argument_spec['region'] = dict(type='str')
-    argument_spec['kind'] = dict(type='str', default='Basic', choices=['Basic', 'Standard', 'Dedicated'])
-    argument_spec['cku'] = dict(type='int', default=1)
-    argument_spec['network'] = dict(type='str')
-    argument_spec['encryption_key'] = dict(type='str', no_log=False)
-
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=_ARG_SPEC,
         supports_check_mode=True,
         required_if=(("state", "present", ("name", "environment", "availability", "cloud", "region", "kind",)),
                      ("kind", "Dedicated", ("cku", "network",)),),
@@ -175,41 +175,54 @@ import traceback
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
 
-from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import AnsibleConfluent, confluent_argument_spec
+from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import AnsibleConfluent, MAX_PAGE_SIZE, confluent_argument_spec, filter_listing
+
+_ARG_SPEC = dict(
+    confluent_argument_spec(),
+    environment=dict(type='str', required=True),
+    ids=dict(type='list', elements='str'),
+    names=dict(type='list', elements='str'),
+)
+
+
+# Filter option, the field it matches and the API query parameter, see
+# filter_listing
+_FILTERS = (
+    ('ids', lambda c: c['id'], None),
+    ('names', lambda c: c['spec']['display_name'], None),
+)
 
 
 def canonical_resource(resource):
-    resource['resource_uri'] = resource['metadata']['resource_name']
-    del(resource['metadata']['resource_name'])
+    resource['resource_uri'] = resource['metadata'].pop('resource_name')
     return(resource)
 
 
 def get_clusters_info(module):
+    p = module.params
+
     confluent = AnsibleConfluent(
         module=module,
         resource_path="/cmk/v2/clusters",
     )
 
-    resources = confluent.query(data={'environment': module.params.get('environment'), 'page_size': 100})
+    data, predicate = filter_listing(module, _FILTERS, {'environment': p['environment'], 'page_size': MAX_PAGE_SIZE})
+    resources = confluent.query_all_pages(data=data)
+    if not resources:
+        return({'clusters': {}})
 
-    if resources and module.params.get('ids'):
-        clusters = [c for c in resources['data'] if c['id'] in module.params.get('ids')]
-    elif resources and module.params.get('names'):
-        clusters = [c for c in resources['data'] if c['spec']['display_name'] in module.params.get('names')]
-    else:
-        clusters = resources['data']
+    # Filter, transform and index clusters in a single pass
+    clusters = {}
+    for c in resources:
+        if predicate is None or predicate(c):
+            clusters[c['id']] = canonical_resource(c)
 
-    return({'clusters': {c['id']: canonical_resource(c) for c in clusters}})
+    return({'clusters': clusters})
 
 
 def main():
-    argument_spec = confluent_argument_spec()
-    argument_spec['environment'] = dict(type='str', required=True)
-    argument_spec['ids'] = dict(type='list', elements='str')
-    argument_spec['names'] = dict(type='list', elements='str')
-
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=_ARG_SPEC,
         supports_check_mode=True,
         mutually_exclusive=[
             ('ids', 'names')
@@ -68,6 +68,12 @@ options:
     description:
       - Dictionary of connector-specific properties.  These properties vary by connector
     type: dict
+notes:
+  - When the C(ANSIBLE_CONFLUENT_ETAG_CACHE) environment variable names a directory, the ETag of a
+    connector whose configuration exactly matches the parameters is stored there, with a digest of
+    the parameters keyed by C(api_secret). On the next run with the same parameters, the connector
+    is read with C(If-None-Match). If the server answers C(304 Not Modified), the module returns the
+    same unchanged result without comparing the configuration.
 """
 
 EXAMPLES = """
@@ -133,37 +139,79 @@ type:
 """
 
 import traceback
+from urllib.parse import quote
+
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
 
-from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import AnsibleConfluent, confluent_argument_spec
+from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import (
+    AnsibleConfluent,
+    confluent_argument_spec,
+    etag_cache_dir,
+    forget_etag,
+    load_etag,
+    state_digest,
+    store_etag,
+)
+
+_ARG_SPEC = dict(
+    confluent_argument_spec(),
+    environment=dict(type='str', required=True),
+    cluster=dict(type='str', required=True),
+    name=dict(type='str', required=True),
+    state=dict(default='present', choices=['present', 'absent', 'pause', 'resume']),
+    kafka_key=dict(type='str', no_log=False),
+    kafka_secret=dict(type='str', no_log=True),
+    connector=dict(type='str'),
+    props=dict(type='dict'),
+)
 
 
 def canonical_resource(resource):
     return(resource)
 
 
+def connectors_path(module):
+    # Every helper talks to the same connectors collection, the HTTP
+    # connection behind it is pooled and reused by AnsibleConfluent
+    p = module.params
+    return("/connect/v1/environments/%s/clusters/%s/connectors" % (p['environment'], p['cluster']))
+
+
+def connector_path(module, name):
+    # Connector names may hold characters such as / ? or spaces, they are
+    # quoted as a single path segment
+    return("%s/%s" % (connectors_path(module), quote(name, safe='')))
+
+
+def connector_config(module):
+    # props are applied last so they keep overriding the fixed fields
+    p = module.params
+    config = {
+        'name': p['name'],
+        'kafka.api.key': p['kafka_key'],
+        'kafka.api.secret': p['kafka_secret'],
+        'connector.class': p['connector'],
+    }
+    if p['props']:
+        config.update(p['props'])
+    return(config)
+
+
 def connect_remove(module, resource_id):
     confluent = AnsibleConfluent(
         module=module,
-        resource_path="/connect/v1/environments/%s/clusters/%s/connectors" % (
-            module.params.get('environment'),
-            module.params.get('cluster')
-        ),
-        resource_key_id=resource_id
+        resource_path=connectors_path(module),
+        resource_key_id=quote(resource_id, safe='')
     )
 
-    return(confluent.absent())
+    return(dict(confluent.absent(), id=resource_id))
 
 
 def connect_pause(module, resource_id):
     confluent = AnsibleConfluent(
         module=module,
-        resource_path="/connect/v1/environments/%s/clusters/%s/connectors/%s/pause" % (
-            module.params.get('environment'),
-            module.params.get('cluster'),
-            module.params.get('name'),
-        ),
+        resource_path="%s/pause" % connector_path(module, resource_id),
     )
 
     return(confluent.query(method='PUT'))
@@ -172,11 +220,7 @@ def connect_pause(module, resource_id):
 def connect_resume(module, resource_id):
     confluent = AnsibleConfluent(
         module=module,
-        resource_path="/connect/v1/environments/%s/clusters/%s/connectors/%s/resume" % (
-            module.params.get('environment'),
-            module.params.get('cluster'),
-            module.params.get('name'),
-        ),
+        resource_path="%s/resume" % connector_path(module, resource_id),
     )
 
     return(confluent.query(method='PUT'))
@@ -185,22 +229,13 @@ def connect_resume(module, resource_id):
 def connect_create(module):
     confluent = AnsibleConfluent(
         module=module,
-        resource_path="/connect/v1/environments/%s/clusters/%s/connectors" % (
-            module.params.get('environment'),
-            module.params.get('cluster')
-        )
+        resource_path=connectors_path(module),
     )
 
-    config_base = {
-        'name': module.params.get('name'),
-        'kafka.api.key': module.params.get('kafka_key'),
-        'kafka.api.secret': module.params.get('kafka_secret'),
-        'connector.class': module.params.get('connector')
-    }
-    config = {**config_base, **module.params.get('props')}
+    config = connector_config(module)
 
     return(canonical_resource(confluent.create({
-        'name': module.params.get('name'),
+        'name': module.params['name'],
         'config': config,
     })))
 
@@ -208,80 +243,79 @@ def connect_create(module):
 def connect_update(module, connector):
     confluent = AnsibleConfluent(
         module=module,
-        resource_path="/connect/v1/environments/%s/clusters/%s/connectors/%s" % (
-            module.params.get('environment'),
-            module.params.get('cluster'),
-            module.params.get('name'),
-        ),
+        resource_path=connector_path(module, module.params['name']),
         resource_key_id='config',
         resource_update_method='PUT',
     )
 
-    config_base = {
-        'name': module.params.get('name'),
-        'kafka.api.key': module.params.get('kafka_key'),
-        'kafka.api.secret': module.params.get('kafka_secret'),
-        'connector.class': module.params.get('connector')
-    }
-    config = {**config_base, **module.params.get('props')}
+    config = connector_config(module)
 
-    return(canonical_resource(confluent.update(connector['info']['config'], config, required=config)))
+    return(canonical_resource(confluent.update(connector['config'], config, required=config)))
 
 
-def get_connectors(module):
+def get_connector(module, etag=None):
+    # Reads the single managed connector and its ETag. The connector is None
+    # when it has not changed since etag and empty when it does not exist
     confluent = AnsibleConfluent(
         module=module,
-        resource_path="/connect/v1/environments/%s/clusters/%s/connectors" % (
-            module.params.get('environment'),
-            module.params.get('cluster'),
-        )
+        resource_path=connectors_path(module),
+        resource_key_id=quote(module.params.get('name'), safe=''),
     )
 
-    resources = confluent.query(data={'expand': 'status,info', 'page_size': 100})
-
-    return(resources)
+    return(confluent.get_if_none_match(etag))
 
 
 def connect_process(module):
-    # Get existing connect if it exists
-    connectors = get_connectors(module)
-    if module.params.get('name') in connectors:
-        connector = connectors[module.params.get('name')]
-    else:
-        connector = None
+    p = module.params
+    state = p['state']
+    etag_key = (p['environment'], p['cluster'], p['name'])
+
+    # A connector left unchanged since a previous run found its configuration
+    # equal to the same parameters needs neither a diff nor an update
+    digest = None
+    etag = None
+    if state == 'present' and etag_cache_dir():
+        digest = state_digest([p[k] for k in ('name', 'kafka_key', 'kafka_secret', 'connector', 'props')], p['api_secret'])
+        etag = load_etag(etag_key, digest)
+
+    # Get existing connect if it exists. On 304 Not Modified its configuration
+    # is still the one built from these parameters
+    connector, etag = get_connector(module, etag)
+    if connector is None:
+        return(dict(connector_config(module), changed=False))
+    connector = connector or None
 
     # Manage connect removal
-    if module.params.get('state') == 'absent' and not connector:
+    if state == 'absent' and not connector:
         return({"changed": False})
-    elif module.params.get('state') == 'absent' and connector:
-        return(connect_remove(module, connector['info']['name']))
-    elif module.params.get('state') == 'pause' and connector:
-        return(connect_pause(module, connector['info']['name']))
-    elif module.params.get('state') == 'resume' and connector:
-        return(connect_resume(module, connector['info']['name']))
+    elif state == 'absent' and connector:
+        forget_etag(etag_key)
+        return(connect_remove(module, connector['name']))
+    elif state == 'pause' and connector:
+        return(connect_pause(module, connector['name']))
+    elif state == 'resume' and connector:
+        return(connect_resume(module, connector['name']))
 
     # Create connect
-    elif module.params.get('state') == 'present' and not connector:
+    elif state == 'present' and not connector:
         return(connect_create(module))
 
     # Check for update
     else:
-        return(connect_update(module, connector))
+        # The ETag is only kept when the configuration is exactly the one
+        # built from the parameters, so a later 304 can return it as is
+        matches = connector['config'] == connector_config(module)
+        resource = connect_update(module, connector)
+        if digest and matches and etag and not resource['changed']:
+            store_etag(etag_key, etag, digest)
+        else:
+            forget_etag(etag_key)
+        return(resource)
 
 
 def main():
-    argument_spec = confluent_argument_spec()
-    argument_spec['environment'] = dict(type='str', required=True)
-    argument_spec['cluster'] = dict(type='str', required=True)
-    argument_spec['name'] = dict(type='str', required=True)
-    argument_spec['state'] = dict(default='present', choices=['present', 'absent', 'pause', 'resume'])
-    argument_spec['kafka_key'] = dict(type='str', no_log=False)
-    argument_spec['kafka_secret'] = dict(type='str', no_log=True)
-    argument_spec['connector'] = dict(type='str')
-    argument_spec['props'] = dict(type='dict')
-
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=_ARG_SPEC,
         supports_check_mode=True,
     )
 
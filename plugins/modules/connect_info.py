@@ -45,6 +45,13 @@ options:
       - List of connector classes.
     type: list
     elements: str
+  cache_ttl:
+    description:
+      - Seconds during which the result of an earlier run with the same options is returned without
+        calling the API. The result is kept under C(~/.ansible/tmp/confluent_cache).
+      - C(0) disables the cache.
+    type: int
+    default: 0
 """
 
 EXAMPLES = """
@@ -93,27 +100,71 @@ connectors:
       description: Connector type (either source or sink)
       type: str
       returned: success
+cached:
+  description: Whether the result was read from the C(cache_ttl) cache instead of the API
+  returned: when I(cache_ttl) is set
+  type: bool
+  sample: true
 """
 
 import traceback
+from urllib.parse import quote
+
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
 
-from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import AnsibleConfluent, confluent_argument_spec
+from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import (
+    AnsibleConfluent,
+    MAX_PAGE_SIZE,
+    cached_result,
+    confluent_argument_spec,
+    filter_listing,
+    map_concurrently,
+)
+
+_ARG_SPEC = dict(
+    confluent_argument_spec(),
+    environment=dict(type='str', required=True),
+    cluster=dict(type='str', required=True),
+    names=dict(type='list', elements='str'),
+    types=dict(type='list', elements='str'),
+    connectors=dict(type='list', elements='str'),
+    cache_ttl=dict(type='int', default=0),
+)
+
+# Up to this many names are read directly, in parallel, instead of listing
+# every connector of the cluster with its status and info expanded
+_MAX_DIRECT_NAMES = 16
+
+# Filter option, the connector field it matches and the API query parameter,
+# see filter_listing
+_FILTERS = (
+    ('names', lambda c: c['info']['name'], None),
+    ('types', lambda c: c['info']['type'], None),
+    ('connectors', lambda c: c['info']['config']['connector.class'], None),
+)
 
 
 def canonical_resource(resource):
-    del(resource['id'])
-    resource['name'] = resource['info']['name']
-    del(resource['info']['name'])
-    resource['type'] = resource['info']['type']
-    del(resource['info']['type'])
-    resource['config'] = resource['info']['config']
-    del(resource['info']['config'])
-    resource['tasks'] = resource['status']['tasks']
-    del(resource['info'])
-    resource['status'] = resource['status']['connector']
-    return(resource)
+    info = resource['info']
+    status = resource['status']
+    return({
+        'name': info['name'],
+        'type': info['type'],
+        'config': info['config'],
+        'tasks': status['tasks'],
+        'status': status['connector'],
+    })
+
+
+def get_connector(confluent, name):
+    # Same shape as a listed connector with status and info expanded, None
+    # when the connector does not exist
+    path = "%s/%s" % (confluent.resource_path, quote(name, safe=''))
+    info = confluent.api_query(path=path)
+    if not info:
+        return(None)
+    return({'info': info, 'status': confluent.api_query(path=path + "/status")})
 
 
 def get_connectors_info(module):
@@ -125,35 +176,27 @@ def get_connectors_info(module):
         )
     )
 
-    resources = confluent.query(data={'expand': 'status,info', 'page_size': 100})
+    names = module.params.get('names')
+    if names and len(names) <= _MAX_DIRECT_NAMES:
+        found = map_concurrently(module, lambda name: get_connector(confluent, name), dict.fromkeys(names))
+        connectors = [c for c in found if c is not None]
+        return({'connectors': {c['info']['name']: canonical_resource(c) for c in connectors}})
 
-    if module.params.get('names'):
-        connectors = [c for c in resources.values() if c['info']['name'] in module.params.get('names')]
-    elif module.params.get('types'):
-        connectors = [c for c in resources.values() if c['info']['type'] in module.params.get('types')]
-    elif module.params.get('connectors'):
-        connectors = [c for c in resources.values() if c['info']['config']['connector.class'] in module.params.get('connectors')]
-    else:
-        connectors = resources.values()
+    # Connectors the filter rejects are discarded while the listing is decoded
+    data, predicate = filter_listing(module, _FILTERS, {'expand': 'status,info', 'page_size': MAX_PAGE_SIZE})
+    resources = confluent.query_items(data=data, predicate=predicate)
 
-    return({'connectors': {c['info']['name']: canonical_resource(c) for c in connectors}})
+    return({'connectors': {c['info']['name']: canonical_resource(c) for c in resources.values()}})
 
 
 def main():
-    argument_spec = confluent_argument_spec()
-    argument_spec['environment'] = dict(type='str', required=True)
-    argument_spec['cluster'] = dict(type='str', required=True)
-    argument_spec['names'] = dict(type='list', elements='str')
-    argument_spec['types'] = dict(type='list', elements='str')
-    argument_spec['connectors'] = dict(type='list', elements='str')
-
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=_ARG_SPEC,
         supports_check_mode=True,
     )
 
     try:
-        module.exit_json(**get_connectors_info(module))
+        module.exit_json(**cached_result(module, ('environment', 'cluster', 'names', 'types', 'connectors'), get_connectors_info))
     except Exception as e:
         module.fail_json(msg='failed to get connect info, error: %s' %
                          (to_native(e)), exception=traceback.format_exc())
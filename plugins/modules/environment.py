@@ -82,12 +82,24 @@ import traceback
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
 
-from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import AnsibleConfluent, confluent_argument_spec
+from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import (
+    AnsibleConfluent,
+    MAX_PAGE_SIZE,
+    confluent_argument_spec,
+    drop_listing_cache,
+    environments_cache_path,
+)
+
+_ARG_SPEC = dict(
+    confluent_argument_spec(),
+    id=dict(type='str'),
+    name=dict(type='str'),
+    state=dict(default='present', choices=['present', 'absent']),
+)
 
 
 def canonical_resource(resource):
-    resource['resource_uri'] = resource['metadata']['resource_name']
-    del(resource['metadata']['resource_name'])
+    resource['resource_uri'] = resource['metadata'].pop('resource_name')
     return(resource)
 
 
@@ -128,47 +140,74 @@ def get_environments(module):
         resource_path="/org/v2/environments",
     )
 
-    resources = confluent.query(data={'page_size': 100})
+    # A listing shared through the opt-in cache file is searched in memory
+    cache_path = environments_cache_path()
+    if cache_path:
+        return(iter(confluent.query_all_pages_cached(cache_path, data={'page_size': MAX_PAGE_SIZE})))
+
+    # Pages are only requested as the caller iterates
+    return(confluent.iter_query(data={'page_size': MAX_PAGE_SIZE}))
+
+
+def get_environment(module, resource_id):
+    # Reads a single environment, an empty dict when it does not exist
+    confluent = AnsibleConfluent(
+        module=module,
+        resource_path="/org/v2/environments",
+        resource_key_id=resource_id,
+    )
+
+    return(confluent.get())
 
-    if 'data' in resources:
-        return(resources['data'])
-    else:
-        return([])
+
+def find_environment(module):
+    # An id is read directly, a name is searched for in the listing which
+    # stops at the first match
+    wanted_id = module.params.get('id')
+    wanted_name = module.params.get('name')
+
+    if wanted_id:
+        environment = get_environment(module, wanted_id)
+        if environment:
+            return(environment)
+
+    if wanted_name:
+        for e in get_environments(module):
+            if e['display_name'] == wanted_name:
+                return(e)
+
+    return(None)
 
 
 def environment_process(module):
+    state = module.params['state']
+
     # Get existing environment if it exists
-    environments = get_environments(module)
-    if module.params.get('id') and len([e for e in environments if e['id'] in module.params.get('id')]):
-        environment = [e for e in environments if e['id'] in module.params.get('id')][0]
-    elif module.params.get('name') and len([e for e in environments if e['display_name'] in module.params.get('name')]):
-        environment = [e for e in environments if e['display_name'] in module.params.get('name')][0]
-    else:
-        environment = None
+    environment = find_environment(module)
 
     # Manage environment removal
-    if module.params.get('state') == 'absent' and not environment:
+    if state == 'absent' and not environment:
         return({"changed": False})
-    elif module.params.get('state') == 'absent' and environment:
-        return(environment_remove(module, environment['id']))
+    elif state == 'absent' and environment:
+        resource = environment_remove(module, environment['id'])
 
     # Create environment
-    elif module.params.get('state') == 'present' and not environment:
-        return(environment_create(module))
+    elif state == 'present' and not environment:
+        resource = environment_create(module)
 
     # Check for update
     else:
-        return(environment_update(module, environment))
+        resource = environment_update(module, environment)
+
+    # A changed environment makes the shared listing stale
+    if resource.get('changed'):
+        drop_listing_cache(environments_cache_path())
+    return(resource)
 
 
 def main():
-    argument_spec = confluent_argument_spec()
-    argument_spec['id'] = dict(type='str')
-    argument_spec['name'] = dict(type='str')
-    argument_spec['state'] = dict(default='present', choices=['present', 'absent'])
-
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=_ARG_SPEC,
         supports_check_mode=True,
     )
 
@@ -32,6 +32,13 @@ options:
       - Mutually exclusive when used with `names`
     type: list
     elements: str
+  cache_ttl:
+    description:
+      - Seconds during which the result of an earlier run with the same options is returned without
+        calling the API. The result is kept under C(~/.ansible/tmp/confluent_cache).
+      - C(0) disables the cache.
+    type: int
+    default: 0
 """
 
 EXAMPLES = """
@@ -74,18 +81,43 @@ environments:
       description: Environment metadata, including create timestamp and updated timestamp
       type: dict
       returned: success
+cached:
+  description: Whether the result was read from the C(cache_ttl) cache instead of the API
+  returned: when I(cache_ttl) is set
+  type: bool
+  sample: true
 """
 
 import traceback
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
 
-from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import AnsibleConfluent, confluent_argument_spec
+from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import (
+    AnsibleConfluent,
+    MAX_PAGE_SIZE,
+    cached_result,
+    confluent_argument_spec,
+    environments_cache_path,
+    filter_listing,
+)
+
+_ARG_SPEC = dict(
+    confluent_argument_spec(),
+    ids=dict(type='list', elements='str'),
+    names=dict(type='list', elements='str'),
+    cache_ttl=dict(type='int', default=0),
+)
+
+# Filter option, the field it matches and the API query parameter, see
+# filter_listing
+_FILTERS = (
+    ('ids', lambda e: e['id'], None),
+    ('names', lambda e: e['display_name'], None),
+)
 
 
 def canonical_resource(resource):
-    resource['resource_uri'] = resource['metadata']['resource_name']
-    del(resource['metadata']['resource_name'])
+    resource['resource_uri'] = resource['metadata'].pop('resource_name')
     return(resource)
 
 
@@ -95,25 +127,29 @@ def get_environments_info(module):
         resource_path="/org/v2/environments",
     )
 
-    resources = confluent.query(data={'page_size': 100})
-
-    if module.params.get('ids'):
-        environments = [e for e in resources['data'] if e['id'] in module.params.get('ids')]
-    elif module.params.get('names'):
-        environments = [e for e in resources['data'] if e['display_name'] in module.params.get('names')]
+    # The listing is shared with the environment module through the opt-in
+    # cache file
+    data, predicate = filter_listing(module, _FILTERS, {'page_size': MAX_PAGE_SIZE})
+    cache_path = environments_cache_path()
+    if cache_path:
+        resources = confluent.query_all_pages_cached(cache_path, data=data)
     else:
-        environments = resources['data']
+        resources = confluent.query_all_pages(data=data)
+    if not resources:
+        return({'environments': {}})
 
-    return({'environments': {e['id']: canonical_resource(e) for e in environments}})
+    # Matching environments are written straight into the result
+    environments = {}
+    for e in resources:
+        if predicate is None or predicate(e):
+            environments[e['id']] = canonical_resource(e)
 
+    return({'environments': environments})
 
-def main():
-    argument_spec = confluent_argument_spec()
-    argument_spec['ids'] = dict(type='list', elements='str')
-    argument_spec['names'] = dict(type='list', elements='str')
 
+def main():
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=_ARG_SPEC,
         supports_check_mode=True,
         mutually_exclusive=[
             ('ids', 'names')
@@ -121,7 +157,7 @@ def main():
     )
 
     try:
-        module.exit_json(**get_environments_info(module))
+        module.exit_json(**cached_result(module, ('ids', 'names'), get_environments_info))
     except Exception as e:
         module.fail_json(msg='failed to get environment info, error: %s' %
                          (to_native(e)), exception=traceback.format_exc())
@@ -39,12 +39,12 @@ from ansible.module_utils.basic import AnsibleModule
 
 from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import AnsibleConfluent, confluent_argument_spec
 
+_ARG_SPEC = confluent_argument_spec()
 
-def main():
-    argument_spec = confluent_argument_spec()
 
+def main():
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=_ARG_SPEC,
         supports_check_mode=True,
     )
 
@@ -43,6 +43,13 @@ options:
   principal:
     description: Role
     type: str
+  principals:
+    description:
+      - Manage the binding of `role` for several principals in one task, each as if given as `principal`.
+      - The role bindings of `resource_uri` are listed once and the principals share `state`.
+      - Mutually exclusive with `id` and `principal`.
+    type: list
+    elements: str
   state:
     description:
       - If `absent`, the service account will be removed.
@@ -90,6 +97,15 @@ EXAMPLES = """
     principal: sa-j31z28
     role: CloudClusterAdmin
     state: present
+
+- name: Bind a role to several service accounts in one task
+  confluent.cloud.role_binding:
+    resource_uri: "{{ result.resource_uri }}"
+    principals:
+      - sa-j31z28
+      - sa-k42a39
+    role: MetricsViewer
+    state: present
 """
 
 RETURN = """
@@ -113,20 +129,45 @@ metadata:
   description: User metadata, including create timestamp and updated timestamp
   type: dict
   returned: success
+role_bindings:
+  description: Result for each principal, keyed by principal as given
+  type: dict
+  returned: when I(principals) is given
 """
 
-import re
 import traceback
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
 
-from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import AnsibleConfluent, confluent_argument_spec
+from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import (
+    AnsibleConfluent,
+    MAX_PAGE_SIZE,
+    confluent_argument_spec,
+    map_concurrently,
+)
+
+_ARG_SPEC = dict(
+    confluent_argument_spec(),
+    id=dict(type='str'),
+    resource_uri=dict(type='str', required=True),
+    role=dict(type='str'),
+    principal=dict(type='str'),
+    principals=dict(type='list', elements='str'),
+    state=dict(default='present', choices=['present', 'absent']),
+)
+
+# Bare user and service account ids are given the User: principal prefix
+_PRINCIPAL_PREFIXES = ('u-', 'sa-')
+
+
+def full_principal(principal):
+    if principal.startswith(_PRINCIPAL_PREFIXES):
+        return("User:" + principal)
+    return(principal)
 
 
 def canonical_resource(resource):
-    resource['role'] = resource['role_name']
-    del(resource['role_name'])
-    return(resource)
+    return({('role' if k == 'role_name' else k): v for k, v in resource.items()})
 
 
 def role_binding_remove(module, resource_id):
@@ -139,16 +180,18 @@ def role_binding_remove(module, resource_id):
     return(confluent.absent())
 
 
-def role_binding_create(module):
+def role_binding_create(module, principal):
+    p = module.params
+
     confluent = AnsibleConfluent(
         module=module,
         resource_path="/iam/v2/role-bindings",
     )
 
     return(canonical_resource(confluent.create({
-        'principal': module.params.get('principal'),
-        'role_name': module.params.get('role'),
-        'crn_pattern': module.params.get('resource_uri'),
+        'principal': principal,
+        'role_name': p['role'],
+        'crn_pattern': p['resource_uri'],
     })))
 
 
@@ -158,56 +201,94 @@ def get_role_bindings(module):
         resource_path="/iam/v2/role-bindings",
     )
 
-    resources = confluent.query(data={'crn_pattern': module.params.get('resource_uri'), 'page_size': 100})
+    # Pages are only requested as the caller iterates
+    return(confluent.iter_query(data={'crn_pattern': module.params.get('resource_uri'), 'page_size': MAX_PAGE_SIZE}))
 
-    return(resources['data'])
 
+def find_role_binding(module):
+    # An id match takes precedence over a role and principal match, the
+    # listing stops as soon as the binding can no longer be beaten
+    wanted_id = module.params.get('id')
+    role = module.params.get('role')
+    principal = module.params.get('principal')
+    by_role = role and principal
+    if not wanted_id and not by_role:
+        return(None)
 
-def role_binding_process(module):
-    # Get existing role_binding if it exists
-    role_bindings = get_role_bindings(module)
-
-    if module.params.get('id') and len([rb for rb in role_bindings if rb['id'] == module.params.get('id')]):
-        role_binding = [rb for rb in role_bindings if rb['id'] == module.params.get('id')][0]
-    elif (module.params.get('role') and module.params.get('principal')
-          and len([rb for rb in role_bindings
-                  if (rb['role_name'] == module.params.get('role')
-                      and rb['principal'] == module.params.get('principal'))])):
-        role_binding = [rb for rb in role_bindings if rb['role_name'] == module.params.get('role') and rb['principal'] == module.params.get('principal')][0]
-    else:
-        role_binding = None
+    match = None
+    for rb in get_role_bindings(module):
+        if wanted_id and rb['id'] == wanted_id:
+            return(rb)
+        if match is None and by_role and rb['role_name'] == role and rb['principal'] == principal:
+            if not wanted_id:
+                return(rb)
+            match = rb
+
+    return(match)
+
+
+def role_binding_state(module, role_binding, principal):
+    state = module.params['state']
 
     # Manage role_binding removal
-    if module.params.get('state') == 'absent' and not role_binding:
+    if state == 'absent' and not role_binding:
         return({"changed": False})
-    elif module.params.get('state') == 'absent' and role_binding:
+    elif state == 'absent' and role_binding:
         return(role_binding_remove(module, role_binding['id']))
 
     # Create role_binding
-    elif module.params.get('state') == 'present' and not role_binding:
-        return(role_binding_create(module))
+    elif state == 'present' and not role_binding:
+        return(role_binding_create(module, principal))
 
     # Immutable resource is present
     else:
-        return(canonical_resource(role_binding))
+        return(dict(canonical_resource(role_binding), changed=False))
 
 
-def main():
-    argument_spec = confluent_argument_spec()
-    argument_spec['id'] = dict(type='str')
-    argument_spec['resource_uri'] = dict(type='str', required=True)
-    argument_spec['role'] = dict(type='str')
-    argument_spec['principal'] = dict(type='str')
-    argument_spec['state'] = dict(default='present', choices=['present', 'absent'])
+def role_binding_process(module):
+    # Several principals are reconciled concurrently against one listing of
+    # the resource_uri, the bindings already reconciled are reported when
+    # another one fails
+    principals = module.params.get('principals')
+    if principals:
+        role = module.params['role']
+        by_principal = {}
+        for rb in get_role_bindings(module):
+            if rb['role_name'] == role:
+                by_principal.setdefault(rb['principal'], rb)
+        principals = list(dict.fromkeys(principals))
+        results = map_concurrently(
+            module,
+            lambda p: role_binding_state(module, by_principal.get(full_principal(p)), full_principal(p)),
+            principals,
+            result_key='role_bindings',
+        )
+        return({
+            'changed': any(r['changed'] for r in results),
+            'role_bindings': dict(zip(principals, results)),
+        })
+
+    # Get existing role_binding if it exists
+    role_binding = find_role_binding(module)
+    return(role_binding_state(module, role_binding, module.params.get('principal')))
 
+
+def main():
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=_ARG_SPEC,
         supports_check_mode=True,
+        mutually_exclusive=[
+            ('principals', 'id'),
+            ('principals', 'principal'),
+        ],
+        required_by={
+            'principals': 'role',
+        },
     )
 
-    if module.params.get('principal'):
-        if re.match("(u|sa)", module.params.get('principal')):
-            module.params['principal'] = "User:" + module.params.get('principal')
+    principal = module.params.get('principal')
+    if principal:
+        module.params['principal'] = full_principal(principal)
 
     try:
         module.exit_json(**role_binding_process(module))
@@ -93,13 +93,21 @@ import traceback
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
 
-from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import AnsibleConfluent, confluent_argument_spec
+from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import AnsibleConfluent, MAX_PAGE_SIZE, confluent_argument_spec, filter_listing
 
+_ARG_SPEC = dict(
+    confluent_argument_spec(),
+    resource_uri=dict(type='str', required=True),
+    principals=dict(type='list', elements='str'),
+    roles=dict(type='list', elements='str'),
+)
 
-def canonical_resource(resource):
-    resource['role'] = resource['role_name']
-    del(resource['role_name'])
-    return(resource)
+# Filter option, the field it matches and the API query parameter, see
+# filter_listing
+_FILTERS = (
+    ('principals', lambda rb: rb['principal'], 'principal'),
+    ('roles', lambda rb: rb['role_name'], 'role_name'),
+)
 
 
 def get_role_bindings_info(module):
@@ -108,26 +116,25 @@ def get_role_bindings_info(module):
         resource_path="/iam/v2/role-bindings",
     )
 
-    resources = confluent.query(data={'crn_pattern': module.params.get('resource_uri'), 'page_size': 100})
+    data, predicate = filter_listing(module, _FILTERS, {'crn_pattern': module.params.get('resource_uri'), 'page_size': MAX_PAGE_SIZE})
+    resources = confluent.query(data=data)
+    if not resources or not resources.get('data'):
+        return({'role_bindings': {}})
 
-    if resources and module.params.get('principals'):
-        role_bindings = [rb for rb in resources['data'] if rb['principal'] in module.params.get('principals')]
-    elif resources and module.params.get('roles'):
-        role_bindings = [rb for rb in resources['data'] if rb['role_name'] in module.params.get('roles')]
-    else:
-        role_bindings = resources['data']
+    # Filtered, renamed (role_name to role) and indexed in one pass
+    indexed = {}
+    for rb in resources['data']:
+        if predicate is not None and not predicate(rb):
+            continue
+        rb['role'] = rb.pop('role_name')
+        indexed[rb['id']] = rb
 
-    return({'role_bindings': {rb['id']: canonical_resource(rb) for rb in role_bindings}})
+    return({'role_bindings': indexed})
 
 
 def main():
-    argument_spec = confluent_argument_spec()
-    argument_spec['resource_uri'] = dict(type='str', required=True)
-    argument_spec['principals'] = dict(type='list', elements='str')
-    argument_spec['roles'] = dict(type='list', elements='str')
-
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=_ARG_SPEC,
         supports_check_mode=True,
     )
 
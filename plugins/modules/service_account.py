@@ -29,6 +29,13 @@ options:
       - A human-readable name for the Service Account
       - Cannot be changed after creation
     type: str
+  names:
+    description:
+      - Manage several Service Accounts in one task, each as if given as `name`.
+      - The accounts share `description` and `state` and are processed concurrently.
+      - Mutually exclusive with `id` and `name`.
+    type: list
+    elements: str
   description:
     description:
       - A free-form description of the Service Account
@@ -64,6 +71,13 @@ EXAMPLES = """
   confluent.cloud.service_account:
     name: application_1
     state: absent
+- name: Create several service accounts in one task
+  confluent.cloud.service_account:
+    names:
+      - application_1
+      - application_2
+    description: Application service account
+    state: present
 """
 
 RETURN = """
@@ -87,13 +101,32 @@ metadata:
   description: User metadata, including create timestamp and updated timestamp
   type: dict
   returned: success
+service_accounts:
+  description: Result for each service account, keyed by name
+  type: dict
+  returned: when I(names) is given
 """
 
 import traceback
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
 
-from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import AnsibleConfluent, confluent_argument_spec
+from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import (
+    AnsibleConfluent,
+    MAX_PAGE_SIZE,
+    confluent_argument_spec,
+    index_resources,
+    map_concurrently,
+)
+
+_ARG_SPEC = dict(
+    confluent_argument_spec(),
+    id=dict(type='str'),
+    name=dict(type='str'),
+    names=dict(type='list', elements='str'),
+    description=dict(type='str'),
+    state=dict(default='present', choices=['present', 'absent']),
+)
 
 
 def service_account_remove(module, resource_id):
@@ -118,14 +151,14 @@ def service_account_update(module, service_account):
     }))
 
 
-def service_account_create(module):
+def service_account_create(module, name):
     confluent = AnsibleConfluent(
         module=module,
         resource_path="/iam/v2/service-accounts",
     )
 
     return(confluent.create({
-        'display_name': module.params.get('name'),
+        'display_name': name,
         'description': module.params.get('description'),
     }))
 
@@ -136,47 +169,87 @@ def get_service_accounts(module):
         resource_path="/iam/v2/service-accounts",
     )
 
-    resources = confluent.query(data={'page_size': 100})
+    resources = confluent.query(data={'page_size': MAX_PAGE_SIZE})
 
     return(resources['data'])
 
 
-def service_account_process(module):
-    # Get existing service_account if it exists
-    service_accounts = get_service_accounts(module)
+def get_service_account(module, resource_id):
+    # Reads a single service account, an empty dict when it does not exist
+    confluent = AnsibleConfluent(
+        module=module,
+        resource_path="/iam/v2/service-accounts",
+        resource_key_id=resource_id,
+    )
+
+    return(confluent.get())
 
-    if module.params.get('id') and len([u for u in service_accounts if u['id'] == module.params.get('id')]):
-        service_account = [sa for sa in service_accounts if sa['id'] == module.params.get('id')][0]
-    elif module.params.get('name') and len([u for u in service_accounts if u['display_name'] == module.params.get('name')]):
-        service_account = [sa for sa in service_accounts if sa['display_name'] == module.params.get('name')][0]
-    else:
-        service_account = None
+
+def find_service_account(module):
+    # An id is read directly, a name is searched for in the listing
+    wanted_id = module.params.get('id')
+    wanted_name = module.params.get('name')
+
+    if wanted_id:
+        service_account = get_service_account(module, wanted_id)
+        if service_account:
+            return(service_account)
+
+    if wanted_name:
+        return(next((sa for sa in get_service_accounts(module) if sa['display_name'] == wanted_name), None))
+
+    return(None)
+
+
+def service_account_state(module, service_account, name):
+    state = module.params.get('state')
 
     # Manage service_account removal
-    if module.params.get('state') == 'absent' and not service_account:
+    if state == 'absent' and not service_account:
         return({"changed": False})
-    elif module.params.get('state') == 'absent' and service_account:
+    elif state == 'absent' and service_account:
         return(service_account_remove(module, service_account['id']))
 
     # Create service_account
-    elif module.params.get('state') == 'present' and not service_account:
-        return(service_account_create(module))
+    elif state == 'present' and not service_account:
+        return(service_account_create(module, name))
 
     # Check for update
     else:
         return(service_account_update(module, service_account))
 
 
-def main():
-    argument_spec = confluent_argument_spec()
-    argument_spec['id'] = dict(type='str')
-    argument_spec['name'] = dict(type='str')
-    argument_spec['description'] = dict(type='str')
-    argument_spec['state'] = dict(default='present', choices=['present', 'absent'])
+def service_account_process(module):
+    # Several names are reconciled concurrently against one listing, the
+    # service accounts already reconciled are reported when another one fails
+    names = module.params.get('names')
+    if names:
+        _by_id, by_name = index_resources(get_service_accounts(module), lambda sa: sa['display_name'])
+        names = list(dict.fromkeys(names))
+        results = map_concurrently(
+            module,
+            lambda n: service_account_state(module, by_name.get(n), n),
+            names,
+            result_key='service_accounts',
+        )
+        return({
+            'changed': any(r['changed'] for r in results),
+            'service_accounts': dict(zip(names, results)),
+        })
+
+    # Get existing service_account if it exists
+    service_account = find_service_account(module)
+    return(service_account_state(module, service_account, module.params.get('name')))
+
 
+def main():
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=_ARG_SPEC,
         supports_check_mode=True,
+        mutually_exclusive=[
+            ('names', 'id'),
+            ('names', 'name'),
+        ]
     )
 
     try:
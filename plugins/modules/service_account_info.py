@@ -81,7 +81,20 @@ import traceback
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
 
-from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import AnsibleConfluent, confluent_argument_spec
+from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import AnsibleConfluent, MAX_PAGE_SIZE, confluent_argument_spec, filter_listing
+
+_ARG_SPEC = dict(
+    confluent_argument_spec(),
+    ids=dict(type='list', elements='str'),
+    names=dict(type='list', elements='str'),
+)
+
+# Filter option, the field it matches and the API query parameter, see
+# filter_listing
+_FILTERS = (
+    ('ids', lambda s: s['id'], None),
+    ('names', lambda s: s['display_name'], None),
+)
 
 
 def get_service_accounts_info(module):
@@ -90,25 +103,20 @@ def get_service_accounts_info(module):
         resource_path="/iam/v2/service-accounts",
     )
 
-    resources = confluent.query(data={'page_size': 100})
+    data, predicate = filter_listing(module, _FILTERS, {'page_size': MAX_PAGE_SIZE})
+    resources = confluent.query(data=data)
+    if not resources or not resources.get('data'):
+        return({'service_accounts': {}})
 
-    if resources and module.params.get('ids'):
-        service_accounts = [u for u in resources['data'] if u['id'] in module.params.get('ids')]
-    elif resources and module.params.get('names'):
-        service_accounts = [u for u in resources['data'] if u['display_name'] in module.params.get('names')]
-    else:
-        service_accounts = resources['data']
-
-    return({'service_accounts': {s['id']: s for s in service_accounts}})
+    # Filtered and indexed in one pass
+    return({'service_accounts': {
+        s['id']: s for s in resources['data'] if predicate is None or predicate(s)
+    }})
 
 
 def main():
-    argument_spec = confluent_argument_spec()
-    argument_spec['ids'] = dict(type='list', elements='str')
-    argument_spec['names'] = dict(type='list', elements='str')
-
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=_ARG_SPEC,
         supports_check_mode=True,
         mutually_exclusive=[
             ('ids', 'names')
@@ -46,6 +46,13 @@ options:
       - The user's email address.
       - Immutable after deployment.
     type: str
+  emails:
+    description:
+      - Manage several users in one task, each as if given as `email`.
+      - The users share `state` and are processed concurrently.
+      - Mutually exclusive with `id`, `name` and `email`.
+    type: list
+    elements: str
 """
 
 EXAMPLES = """
@@ -62,6 +69,12 @@ EXAMPLES = """
   confluent.cloud.user:
     email: john.smith@example.com
     state: absent
+- name: Invite several users in one task
+  confluent.cloud.user:
+    emails:
+      - john.smith@example.com
+      - jane.doe@example.com
+    state: present
 """
 
 RETURN = """
@@ -85,13 +98,35 @@ metadata:
   description: User metadata, including create timestamp and updated timestamp
   type: dict
   returned: success
+users:
+  description: Result for each user, keyed by email
+  type: dict
+  returned: when I(emails) is given
 """
 
 import traceback
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
 
-from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import AnsibleConfluent, confluent_argument_spec
+from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import (
+    AnsibleConfluent,
+    confluent_argument_spec,
+    drop_listing_cache,
+    index_resources,
+    invited_user,
+    list_users,
+    map_concurrently,
+    users_cache_path,
+)
+
+_ARG_SPEC = dict(
+    confluent_argument_spec(),
+    id=dict(type='str'),
+    name=dict(type='str'),
+    email=dict(type='str'),
+    emails=dict(type='list', elements='str'),
+    state=dict(default='present', choices=['present', 'absent']),
+)
 
 
 def user_remove(module, user):
@@ -123,85 +158,110 @@ def user_update(module, user):
     }))
 
 
-def user_create(module):
+def user_create(module, email):
     confluent = AnsibleConfluent(
         module=module,
         resource_path="/iam/v2/invitations",
     )
 
     response = confluent.create({
-        'email': module.params.get('email'),
+        'email': email,
     })
 
     if 'user' in response:
-        response['full_name'] = None
-        response['invitation'] = response['id']
-        response['id'] = response['user']['id']
+        response = invited_user(response)
 
     return(response)
 
 
-def get_users(module):
+def get_user(module, resource_id):
+    # Reads a single user, an empty dict when it does not exist
     confluent = AnsibleConfluent(
         module=module,
         resource_path="/iam/v2/users",
+        resource_key_id=resource_id,
     )
-    users_resources = confluent.query(data={'page_size': 100})
-    resources = []
-    if 'data' in users_resources:
-        resources = users_resources['data']
 
-    confluent = AnsibleConfluent(
-        module=module,
-        resource_path="/iam/v2/invitations",
-    )
-    invitations_resources = confluent.query(data={'page_size': 100})
-    if 'data' in invitations_resources:
-        for user in invitations_resources['data']:
-            user['full_name'] = None
-            user['invitation'] = user['id']
-            user['id'] = user['user']['id']
-            resources.append(user)
+    return(confluent.get())
 
-    return(resources)
 
+def find_user(module):
+    # An id is read directly. Invited users only appear in the listing, which
+    # is also searched when only the email is known
+    wanted_id = module.params.get('id')
+    wanted_email = module.params.get('email')
 
-def user_process(module):
-    # Get existing user if it exists
-    users = get_users(module)
+    if wanted_id:
+        user = get_user(module, wanted_id)
+        if user:
+            return(user)
+    elif not wanted_email:
+        return(None)
 
-    if module.params.get('id') and len([u for u in users if u['id'] == module.params.get('id')]):
-        user = [u for u in users if u['id'] == module.params.get('id')][0]
-    elif module.params.get('email') and len([u for u in users if u['email'] == module.params.get('email')]):
-        user = [u for u in users if u['email'] == module.params.get('email')][0]
-    else:
-        user = None
+    # One pass indexes both keys, an id match takes precedence over an email match
+    by_id, by_email = index_resources(list_users(module), lambda u: u['email'])
+    return(by_id.get(wanted_id) or by_email.get(wanted_email))
+
+
+def user_state(module, user, email):
+    state = module.params.get('state')
 
     # Manage user removal
-    if module.params.get('state') == 'absent' and not user:
+    if state == 'absent' and not user:
         return({"changed": False})
-    elif module.params.get('state') == 'absent' and user:
+    elif state == 'absent' and user:
         return(user_remove(module, user))
 
     # Create user
-    elif module.params.get('state') == 'present' and not user:
-        return(user_create(module))
+    elif state == 'present' and not user:
+        return(user_create(module, email))
 
     # Check for update
     else:
         return(user_update(module, user))
 
 
-def main():
-    argument_spec = confluent_argument_spec()
-    argument_spec['id'] = dict(type='str')
-    argument_spec['name'] = dict(type='str')
-    argument_spec['email'] = dict(type='str')
-    argument_spec['state'] = dict(default='present', choices=['present', 'absent'])
+def reconcile_user(module, user, email):
+    resource = user_state(module, user, email)
 
+    # A changed user makes the shared listing stale
+    if resource.get('changed'):
+        drop_listing_cache(users_cache_path())
+    return(resource)
+
+
+def user_process(module):
+    # Several emails are reconciled concurrently against one listing, the
+    # users already reconciled are reported when another one fails
+    emails = module.params.get('emails')
+    if emails:
+        _by_id, by_email = index_resources(list_users(module), lambda u: u['email'])
+        emails = list(dict.fromkeys(emails))
+        results = map_concurrently(
+            module,
+            lambda e: reconcile_user(module, by_email.get(e), e),
+            emails,
+            result_key='users',
+        )
+        return({
+            'changed': any(r['changed'] for r in results),
+            'users': dict(zip(emails, results)),
+        })
+
+    # Get existing user if it exists
+    user = find_user(module)
+    return(reconcile_user(module, user, module.params.get('email')))
+
+
+def main():
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=_ARG_SPEC,
         supports_check_mode=True,
+        mutually_exclusive=[
+            ('emails', 'id'),
+            ('emails', 'name'),
+            ('emails', 'email'),
+        ]
     )
 
     try:
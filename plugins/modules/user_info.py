@@ -40,6 +40,13 @@ options:
       - Mutually exclusive when used with `names` or `emails`.
     type: list
     elements: str
+  cache_ttl:
+    description:
+      - Seconds during which the result of an earlier run with the same options is returned without
+        calling the API. The result is kept under C(~/.ansible/tmp/confluent_cache).
+      - C(0) disables the cache.
+    type: int
+    default: 0
 """
 
 EXAMPLES = """
@@ -87,57 +94,99 @@ users:
       description: User metadata, including create timestamp and updated timestamp
       type: dict
       returned: success
+cached:
+  description: Whether the result was read from the C(cache_ttl) cache instead of the API
+  returned: when I(cache_ttl) is set
+  type: bool
+  sample: true
 """
 
 import traceback
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
 
-from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import AnsibleConfluent, confluent_argument_spec
-
-
-def get_users_info(module):
+from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import (
+    AnsibleConfluent,
+    MAX_PAGE_SIZE,
+    cached_result,
+    confluent_argument_spec,
+    invited_user,
+    list_users,
+    users_cache_path,
+)
+
+_ARG_SPEC = dict(
+    confluent_argument_spec(),
+    ids=dict(type='list', elements='str'),
+    emails=dict(type='list', elements='str'),
+    names=dict(type='list', elements='str'),
+    cache_ttl=dict(type='int', default=0),
+)
+
+
+def _invitation_field(invitation, field):
+    # The value field takes once the invitation is listed as a user
+    if field == 'id':
+        return(invitation['user']['id'])
+    return(invitation.get(field))
+
+
+def _iter_users(users, invitations, field, wanted):
+    # Invitations are matched before being reshaped into users
+    for u in users:
+        if u[field] in wanted:
+            yield u
+    for i in invitations:
+        if _invitation_field(i, field) in wanted:
+            yield invited_user(i)
+
+
+def list_users_matching(module, field, wanted):
+    # Invitations are only listed when the users alone leave part of the
+    # filter unmatched. They never carry a full name, so a filter on names
+    # never needs them
     confluent = AnsibleConfluent(
         module=module,
         resource_path="/iam/v2/users",
     )
-    users_resources = confluent.query(data={'page_size': 100})
-    resources = []
-    if 'data' in users_resources:
-        resources = users_resources['data']
+    users_resources = confluent.query_all_pages(data={'page_size': MAX_PAGE_SIZE})
+    if field == 'full_name' or wanted <= frozenset(u[field] for u in users_resources):
+        return(_iter_users(users_resources, (), field, wanted))
 
     confluent = AnsibleConfluent(
         module=module,
         resource_path="/iam/v2/invitations",
     )
-    invitations_resources = confluent.query(data={'page_size': 100})
-    if 'data' in invitations_resources:
-        for user in invitations_resources['data']:
-            user['full_name'] = None
-            user['invitation'] = user['id']
-            user['id'] = user['user']['id']
-            resources.append(user)
-
-    if resources and module.params.get('ids'):
-        users = [u for u in resources if u['id'] in module.params.get('ids')]
-    elif resources and module.params.get('emails'):
-        users = [u for u in resources if u['email'] in module.params.get('emails')]
-    elif resources and module.params.get('names'):
-        users = [u for u in resources if u['full_name'] in module.params.get('names')]
+    invitations_resources = confluent.query_all_pages(data={'page_size': MAX_PAGE_SIZE})
+    return(_iter_users(users_resources, invitations_resources, field, wanted))
+
+
+def get_users_info(module):
+    ids = frozenset(module.params.get('ids') or ())
+    emails = frozenset(module.params.get('emails') or ())
+    names = frozenset(module.params.get('names') or ())
+
+    field, wanted = None, None
+    if ids:
+        field, wanted = 'id', ids
+    elif emails:
+        field, wanted = 'email', emails
+    elif names:
+        field, wanted = 'full_name', names
+
+    # Without the shared cache file, a filtered listing avoids requesting
+    # invitations when it can
+    if field and not users_cache_path():
+        users = list_users_matching(module, field, wanted)
     else:
-        users = resources
+        users = (u for u in list_users(module) if not field or u[field] in wanted)
 
     return({'users': {u['id']: u for u in users}})
 
 
 def main():
-    argument_spec = confluent_argument_spec()
-    argument_spec['ids'] = dict(type='list', elements='str')
-    argument_spec['emails'] = dict(type='list', elements='str')
-    argument_spec['names'] = dict(type='list', elements='str')
-
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=_ARG_SPEC,
         supports_check_mode=True,
         mutually_exclusive=[
             ('ids', 'names', 'emails')
@@ -145,7 +194,7 @@ def main():
     )
 
     try:
-        module.exit_json(**get_users_info(module))
+        module.exit_json(**cached_result(module, ('ids', 'emails', 'names'), get_users_info))
     except Exception as e:
         module.fail_json(msg='failed to get user info, error: %s' %
                          (to_native(e)), exception=traceback.format_exc())
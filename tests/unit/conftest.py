@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+
+import pytest
+
+from ansible_collections.confluent.cloud.plugins.module_utils import confluent_api
+
+ENDPOINT = "https://api.confluent.test"
+
+
+class FailJson(Exception):
+    def __init__(self, **kwargs):
+        super(FailJson, self).__init__(kwargs.get('msg'))
+        self.result = kwargs
+
+
+class FakeModule:
+    # The parts of AnsibleModule the client uses
+    FailJson = FailJson
+
+    def __init__(self, **params):
+        self.params = dict(
+            api_endpoint=ENDPOINT,
+            api_key="KEY",
+            api_secret="SECRET",
+            api_timeout=60,
+            api_retries=5,
+            api_retry_max_delay=12,
+            validate_certs=True,
+        )
+        self.params.update(params)
+        self.check_mode = False
+
+    def fail_json(self, **kwargs):
+        raise FailJson(**kwargs)
+
+
+class FakeAPI:
+    # Answers AnsibleConfluent._send from canned responses and records every
+    # request as (method, url, data, headers)
+    def __init__(self):
+        self.responses = {}
+        self.requests = []
+
+    def add(self, method, path, body=None, status=200, headers=None):
+        # Responses queued for the same request are returned in turn, the
+        # last one is repeated
+        self.responses.setdefault((method, ENDPOINT + path), []).append((body, status, headers or {}))
+
+    def listing(self, path, pages):
+        # Queues a paginated listing, each page linking to the next one
+        for n, page in enumerate(pages):
+            url = path if n == 0 else "%s?page_token=%d" % (path.split('?')[0], n)
+            metadata = {}
+            if n < len(pages) - 1:
+                metadata['next'] = "%s%s?page_token=%d" % (ENDPOINT, path.split('?')[0], n + 1)
+            self.add("GET", url, {'data': page, 'metadata': metadata})
+
+    def send(self, confluent, url, method="GET", data=None, extra_headers=None):
+        self.requests.append((method, url, data, extra_headers))
+        queue = self.responses.get((method, url))
+        if not queue:
+            return("", {'status': 404, 'msg': "Not Found", 'url': url})
+        body, status, headers = queue.pop(0) if len(queue) > 1 else queue[0]
+        info = dict((k.lower(), v) for k, v in headers.items())
+        info.update({'status': status, 'msg': "", 'url': url})
+        return("" if body is None else json.dumps(body), info)
+
+
+@pytest.fixture
+def api(monkeypatch, tmp_path):
+    fake = FakeAPI()
+    monkeypatch.setattr(confluent_api.AnsibleConfluent, '_send', lambda self, *args, **kwargs: fake.send(self, *args, **kwargs))
+    monkeypatch.setattr(confluent_api, '_RESULT_CACHE_DIR', str(tmp_path / "results"))
+    for var in (confluent_api.ENVIRONMENTS_CACHE_VAR, confluent_api.USERS_CACHE_VAR, confluent_api.ETAG_CACHE_VAR):
+        monkeypatch.delenv(var, raising=False)
+    return(fake)
+
+
+@pytest.fixture
+def module():
+    return(FakeModule)
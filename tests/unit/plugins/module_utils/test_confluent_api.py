@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.confluent.cloud.plugins.module_utils import confluent_api
+from ansible_collections.confluent.cloud.plugins.module_utils.confluent_api import AnsibleConfluent, ConfluentAPIError
+
+ENV = {'id': 'env-1', 'display_name': 'one'}
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    slept = []
+    monkeypatch.setattr(confluent_api.time, 'sleep', slept.append)
+    return(slept)
+
+
+def environments(module, resource_key_id='id'):
+    return(AnsibleConfluent(module=module, resource_path="/org/v2/environments", resource_key_id=resource_key_id))
+
+
+def test_iter_query_stops_requesting_pages_early(api, module):
+    api.listing("/org/v2/environments?page_size=2", [[{'id': 1}, {'id': 2}], [{'id': 3}, {'id': 4}], [{'id': 5}]])
+    listed = environments(module()).iter_query(data={'page_size': 2})
+
+    assert [next(listed)['id'], next(listed)['id']] == [1, 2]
+    assert len(api.requests) == 1
+    assert next(listed)['id'] == 3
+    assert len(api.requests) == 2
+
+
+def test_query_all_pages_follows_next_links(api, module):
+    api.listing("/org/v2/environments?page_size=2", [[{'id': 1}, {'id': 2}], [{'id': 3}, {'id': 4}], [{'id': 5}]])
+    listed = environments(module()).query_all_pages(data={'page_size': 2})
+
+    assert [r['id'] for r in listed] == [1, 2, 3, 4, 5]
+    assert len(api.requests) == 3
+
+
+def test_retry_on_429_waits_for_retry_after(api, module, sleeps):
+    api.add("GET", "/org/v2/environments/env-1", {'error': 'slow down'}, status=429, headers={'Retry-After': '3'})
+    api.add("GET", "/org/v2/environments/env-1", ENV)
+
+    assert environments(module(), 'env-1').get() == ENV
+    assert len(api.requests) == 2
+    assert sleeps == [3.0]
+
+
+def test_retry_after_past_the_timeout_is_not_waited_for(api, module, sleeps):
+    api.add("GET", "/org/v2/environments/env-1", {'error': 'slow down'}, status=429, headers={'Retry-After': '120'})
+
+    with pytest.raises(module.FailJson) as e:
+        environments(module(api_timeout=10), 'env-1').get()
+    assert e.value.result['fetch_url_info']['status'] == 429
+    assert len(api.requests) == 1
+    assert sleeps == []
+
+
+def test_retries_are_bounded_by_api_retries(api, module, sleeps):
+    api.add("GET", "/org/v2/environments/env-1", {'error': 'unavailable'}, status=503)
+
+    with pytest.raises(module.FailJson):
+        environments(module(api_retries=3), 'env-1').get()
+    assert len(api.requests) == 3
+    assert len(sleeps) == 2
+
+
+def test_backoff(sleeps):
+    assert confluent_api.backoff(retry=0, retry_after=7) == 7
+    first = confluent_api.backoff(retry=0, retry_max_delay=12)
+    assert 1 <= first <= 2
+    assert 1 <= confluent_api.backoff(retry=1, retry_max_delay=12, prev_delay=first) <= first * 3
+    assert confluent_api.backoff(retry=9, retry_max_delay=5, prev_delay=100) <= 5
+    assert len(sleeps) == 4
+
+
+def test_idempotency_key_is_kept_across_retries(api, module, sleeps):
+    api.add("POST", "/org/v2/environments", {'error': 'unavailable'}, status=503)
+    api.add("POST", "/org/v2/environments", ENV, status=201)
+    api.add("POST", "/org/v2/environments", ENV, status=201)
+
+    environments(module()).create({'display_name': 'one'})
+    environments(module()).create({'display_name': 'one'})
+    keys = [headers['Idempotency-Key'] for method, url, data, headers in api.requests]
+    assert len(keys) == 3
+    assert keys[0] == keys[1]
+    assert keys[1] != keys[2]
+
+
+def test_cached_listing(api, module, tmp_path):
+    calls = []
+
+    def compute(m):
+        calls.append(m)
+        return([ENV])
+
+    cache_path = str(tmp_path / "listing.json")
+    assert confluent_api.cached_listing(module(), cache_path, 'environments', compute) == [ENV]
+    assert confluent_api.cached_listing(module(), cache_path, 'environments', compute) == [ENV]
+    assert len(calls) == 1
+
+    # Another key or an expired file lists again
+    confluent_api.cached_listing(module(api_key="OTHER"), cache_path, 'environments', compute)
+    confluent_api.cached_listing(module(api_key="OTHER"), cache_path, 'environments', compute, ttl=0)
+    assert len(calls) == 3
+
+    confluent_api.drop_listing_cache(cache_path)
+    assert not (tmp_path / "listing.json").exists()
+
+
+def test_cached_result(api, module):
+    def get_info(m):
+        return({'environments': {ENV['id']: ENV}})
+
+    assert confluent_api.cached_result(module(cache_ttl=0, ids=None), ('ids',), get_info) == get_info(None)
+
+    first = confluent_api.cached_result(module(cache_ttl=60, ids=None), ('ids',), get_info)
+    second = confluent_api.cached_result(module(cache_ttl=60, ids=None), ('ids',), get_info)
+    other = confluent_api.cached_result(module(cache_ttl=60, ids=['env-2']), ('ids',), get_info)
+    assert not first['cached']
+    assert second['cached']
+    assert not other['cached']
+    assert second['environments'] == first['environments']
+
+
+def test_etags_are_not_stored_by_default(api):
+    confluent_api.store_etag(('connector', 'c1'), '"e1"', 'digest')
+    assert confluent_api.load_etag(('connector', 'c1'), 'digest') is None
+
+
+def test_etags_are_stored_per_digest(api, monkeypatch, tmp_path):
+    monkeypatch.setenv(confluent_api.ETAG_CACHE_VAR, str(tmp_path))
+    key = ('https://api', 'env-1', 'lkc-1', 'a b/c')
+
+    digest = confluent_api.state_digest({'name': 'c1'}, 'SECRET')
+    confluent_api.store_etag(key, '"e1"', digest)
+    assert confluent_api.load_etag(key, digest) == '"e1"'
+    assert confluent_api.load_etag(key, confluent_api.state_digest({'name': 'c2'}, 'SECRET')) is None
+    assert confluent_api.load_etag(key, confluent_api.state_digest({'name': 'c1'}, 'OTHER')) is None
+
+    confluent_api.forget_etag(key)
+    assert confluent_api.load_etag(key, digest) is None
+
+
+def test_get_if_none_match(api, module):
+    api.add("GET", "/org/v2/environments/env-1", ENV, headers={'ETag': '"e1"'})
+    assert environments(module(), 'env-1').get_if_none_match() == (ENV, '"e1"')
+
+    api.responses.clear()
+    api.add("GET", "/org/v2/environments/env-1", status=304)
+    assert environments(module(), 'env-1').get_if_none_match('"e1"') == (None, '"e1"')
+    assert api.requests[-1][3] == {'If-None-Match': '"e1"'}
+
+
+def test_map_concurrently_fails_once_with_partial_results(module):
+    def reconcile(name):
+        if name == 'bad':
+            raise ConfluentAPIError("denied", fetch_url_info={'status': 401})
+        return({'changed': True, 'name': name})
+
+    assert confluent_api.map_concurrently(module(), reconcile, ['a', 'b']) == [
+        {'changed': True, 'name': 'a'}, {'changed': True, 'name': 'b'}]
+
+    with pytest.raises(module.FailJson) as e:
+        confluent_api.map_concurrently(module(), reconcile, ['a', 'bad'], result_key='items')
+    assert e.value.result['msg'] == "denied (1 of 2 requests failed)"
+    assert e.value.result['errors'][0]['item'] == 'bad'
+    assert e.value.result['items'] == {'a': {'changed': True, 'name': 'a'}}
+    assert e.value.result['changed']
+
+
+def test_filter_listing(module):
+    filters = (
+        ('principals', lambda rb: rb['principal'], 'principal'),
+        ('ids', lambda rb: rb['id'], None),
+    )
+    base = {'page_size': 100}
+
+    assert confluent_api.filter_listing(module(principals=None, ids=None), filters, base) == (base, None)
+
+    data, predicate = confluent_api.filter_listing(module(principals=['User:u-1'], ids=None), filters, base)
+    assert data == {'page_size': 100, 'principal': 'User:u-1'}
+    assert predicate({'principal': 'User:u-1'}) and not predicate({'principal': 'User:u-2'})
+
+    # Several values, or a field the API does not filter on, are only
+    # filtered from the listing
+    data, predicate = confluent_api.filter_listing(module(principals=['User:u-1', 'User:u-2'], ids=None), filters, base)
+    assert data == base
+    assert predicate({'principal': 'User:u-2'})
+    data, predicate = confluent_api.filter_listing(module(principals=None, ids=['rb-1']), filters, base)
+    assert data == base
+    assert predicate({'id': 'rb-1'})
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.confluent.cloud.plugins.modules import role_binding
+
+LISTING = "/iam/v2/role-bindings?crn_pattern=crn%3A%2F%2Fenv&page_size=100"
+BOUND = {'id': 'rb-1', 'principal': 'User:sa-1', 'role_name': 'MetricsViewer', 'crn_pattern': 'crn://env'}
+
+
+def params(**kwargs):
+    return(dict(dict(id=None, resource_uri='crn://env', role='MetricsViewer', principal=None, principals=None, state='present'), **kwargs))
+
+
+def test_principals_are_reconciled_against_one_listing(api, module):
+    api.listing(LISTING, [[BOUND]])
+    api.add("POST", "/iam/v2/role-bindings", dict(BOUND, id='rb-2', principal='User:sa-2'), status=201)
+
+    result = role_binding.role_binding_process(module(**params(principals=['sa-1', 'sa-2', 'sa-2'])))
+    assert result['changed']
+    assert sorted(result['role_bindings']) == ['sa-1', 'sa-2']
+    assert not result['role_bindings']['sa-1']['changed']
+    assert result['role_bindings']['sa-1']['role'] == 'MetricsViewer'
+    assert result['role_bindings']['sa-2']['changed']
+    assert [r[0] for r in api.requests] == ['GET', 'POST']
+
+
+def test_principals_only_match_the_given_role(api, module):
+    api.listing(LISTING, [[BOUND]])
+
+    result = role_binding.role_binding_process(module(**params(principals=['sa-1'], role='EnvironmentAdmin', state='absent')))
+    assert not result['changed']
+    assert [r[0] for r in api.requests] == ['GET']
+
+
+def test_principals_absent(api, module):
+    api.listing(LISTING, [[BOUND]])
+    api.add("DELETE", "/iam/v2/role-bindings/rb-1", status=204)
+
+    result = role_binding.role_binding_process(module(**params(principals=['sa-1', 'User:sa-3'], state='absent')))
+    assert result['changed']
+    assert result['role_bindings']['sa-1'] == {'changed': True, 'id': 'rb-1'}
+    assert not result['role_bindings']['User:sa-3']['changed']
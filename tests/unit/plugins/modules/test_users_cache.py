@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.confluent.cloud.plugins.module_utils import confluent_api
+from ansible_collections.confluent.cloud.plugins.modules import user, user_info
+
+USERS = [
+    {'id': 'u-1', 'email': 'one@example.com', 'full_name': 'One', 'kind': 'User'},
+]
+INVITATIONS = [
+    {'id': 'i-2', 'email': 'two@example.com', 'user': {'id': 'u-2'}, 'kind': 'Invitation'},
+]
+
+
+def queue_users(api):
+    api.listing("/iam/v2/users?page_size=100", [USERS])
+    api.listing("/iam/v2/invitations?page_size=100", [INVITATIONS])
+
+
+def test_list_users_merges_invitations(api, module):
+    queue_users(api)
+    users = confluent_api.list_users(module())
+    assert [u['id'] for u in users] == ['u-1', 'u-2']
+    assert users[1]['invitation'] == 'i-2'
+    assert users[1]['full_name'] is None
+
+
+def test_user_reuses_the_listing_written_by_user_info(api, module, monkeypatch, tmp_path):
+    monkeypatch.setenv(confluent_api.USERS_CACHE_VAR, str(tmp_path / "users.json"))
+    queue_users(api)
+
+    listed = user_info.get_users_info(module(ids=None, emails=None, names=None, cache_ttl=0))
+    assert sorted(listed['users']) == ['u-1', 'u-2']
+    assert len(api.requests) == 2
+
+    found = user.find_user(module(id=None, email='two@example.com', state='present'))
+    assert found == listed['users']['u-2']
+    assert len(api.requests) == 2
+
+
+def test_user_info_filters_the_shared_listing(api, module, monkeypatch, tmp_path):
+    monkeypatch.setenv(confluent_api.USERS_CACHE_VAR, str(tmp_path / "users.json"))
+    queue_users(api)
+
+    confluent_api.list_users(module())
+    listed = user_info.get_users_info(module(ids=None, emails=['one@example.com'], names=None, cache_ttl=0))
+    assert list(listed['users']) == ['u-1']
+    assert len(api.requests) == 2
+
+
+def test_changed_user_drops_the_shared_listing(api, module, monkeypatch, tmp_path):
+    cache_path = tmp_path / "users.json"
+    monkeypatch.setenv(confluent_api.USERS_CACHE_VAR, str(cache_path))
+    queue_users(api)
+    api.add("PATCH", "/iam/v2/users/u-1", dict(USERS[0], full_name='Renamed'))
+
+    confluent_api.list_users(module())
+    assert cache_path.exists()
+    result = user.user_process(module(id=None, email='one@example.com', emails=None, name='Renamed', state='present'))
+    assert result['changed']
+    assert not cache_path.exists()